@@ -8,6 +8,7 @@ Combines texasholdem's production-ready engine with pyker's beautiful UI.
 
 import sys
 import os
+import logging
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -83,6 +84,13 @@ def main():
     use_neural_agents = os.getenv('USE_NEURAL_AGENTS', 'true').lower() == 'true'
     verbose_agents = os.getenv('VERBOSE_AGENTS', 'false').lower() == 'true'
 
+    # Agent setup and (in verbose mode) per-decision logs go to the console
+    agent_logger = logging.getLogger('poker_ev.agents')
+    agent_logger.setLevel(logging.DEBUG if verbose_agents else logging.INFO)
+    agent_handler = logging.StreamHandler()
+    agent_handler.setFormatter(logging.Formatter('   %(message)s'))
+    agent_logger.addHandler(agent_handler)
+
     if use_neural_agents:
         try:
             print("🧠 Loading neural network agents...")
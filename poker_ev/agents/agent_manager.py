@@ -4,14 +4,51 @@ Agent manager for coordinating AI opponents
 
 from texasholdem import TexasHoldEm, ActionType
 from texasholdem.agents import random_agent, call_agent
-from typing import Tuple, Callable, Dict, Optional
+from typing import Tuple, Callable, Dict, List, Optional
+import functools
+import logging
+import os
 import random
 from pathlib import Path
 
+from poker_ev.agents.state_converter import MAX_NUM_PLAYERS, engine_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Default location of trained models: model/ in the project root
+_DEFAULT_MODEL_DIR = Path(__file__).resolve().parent.parent.parent / "model"
+
 # Type alias for agent functions
 AgentFunc = Callable[[TexasHoldEm], Tuple[ActionType, int]]
 
 
+@functools.lru_cache(maxsize=8)
+def _scan_models(model_dir: str, mtime_ns: int) -> Dict[str, Tuple[Path, ...]]:
+    """
+    Scan a model directory once and bucket trained models by risk profile
+
+    Args:
+        model_dir: Resolved model directory path
+        mtime_ns: Directory modification time, so adding or removing models
+                  invalidates the cached scan
+
+    Returns:
+        Dict mapping risk profile ('neutral', 'averse', 'seeking') to model files
+    """
+    buckets: Dict[str, list] = {}
+    for model_file in sorted(Path(model_dir).glob("poker_agent_*.pt")):
+        # Pattern: poker_agent_{id}_{risk_profile}.pt
+        # Example: poker_agent_6_seeking.pt -> seeking
+        filename_parts = model_file.stem.split('_')
+        if len(filename_parts) >= 3:
+            risk_profile = filename_parts[-1]  # Last part is risk profile
+        else:
+            risk_profile = 'neutral'  # Fallback
+        buckets.setdefault(risk_profile, []).append(model_file.resolve())
+
+    return {risk_profile: tuple(files) for risk_profile, files in buckets.items()}
+
+
 class AgentManager:
     """
     Manage AI agents for poker.ev
@@ -20,9 +57,18 @@ class AgentManager:
     It provides a unified interface for getting AI actions during gameplay.
     """
 
-    def __init__(self):
-        """Initialize the agent manager"""
-        self.agents: Dict[int, AgentFunc] = {}
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the agent manager
+
+        Args:
+            seed: Optional seed for the agents' random number generator
+                  (for reproducible simulations)
+        """
+        self._rng = random.Random(seed)
+        # Agents indexed by seat (player IDs are small contiguous integers);
+        # None means the seat has no agent
+        self.agents: List[Optional[AgentFunc]] = [None] * MAX_NUM_PLAYERS
 
     def register_agent(self, player_id: int, agent_func: AgentFunc):
         """
@@ -32,6 +78,10 @@ class AgentManager:
             player_id: The player ID (0 is typically human)
             agent_func: Function that takes game state and returns (action, amount)
         """
+        if player_id < 0:
+            raise ValueError(f"Player ID must be non-negative, got {player_id}")
+        if player_id >= len(self.agents):
+            self.agents.extend([None] * (player_id + 1 - len(self.agents)))
         self.agents[player_id] = agent_func
 
     def unregister_agent(self, player_id: int):
@@ -41,8 +91,8 @@ class AgentManager:
         Args:
             player_id: The player ID to remove agent from
         """
-        if player_id in self.agents:
-            del self.agents[player_id]
+        if 0 <= player_id < len(self.agents):
+            self.agents[player_id] = None
 
     def has_agent(self, player_id: int) -> bool:
         """
@@ -54,7 +104,7 @@ class AgentManager:
         Returns:
             True if player has an agent, False otherwise
         """
-        return player_id in self.agents
+        return 0 <= player_id < len(self.agents) and self.agents[player_id] is not None
 
     def get_action(self, game: TexasHoldEm, player_id: int) -> Tuple[ActionType, int]:
         """
@@ -67,11 +117,13 @@ class AgentManager:
         Returns:
             Tuple of (ActionType, amount) representing the agent's decision
         """
-        if player_id in self.agents:
-            return self.agents[player_id](game)
-        else:
-            # Default to random agent if no agent assigned
-            return self.random_agent(game)
+        if 0 <= player_id < len(self.agents):
+            agent = self.agents[player_id]
+            if agent is not None:
+                return agent(game)
+
+        # Default to random agent if no agent assigned
+        return self.random_agent(game)
 
     # ==================== Built-in Agents ====================
     # These are wrappers around texasholdem's built-in agents
@@ -102,8 +154,7 @@ class AgentManager:
         """
         return call_agent(game)
 
-    @staticmethod
-    def aggressive_agent(game: TexasHoldEm) -> Tuple[ActionType, int]:
+    def aggressive_agent(self, game: TexasHoldEm) -> Tuple[ActionType, int]:
         """
         Aggressive agent - raises frequently, rarely folds
 
@@ -113,20 +164,19 @@ class AgentManager:
         Returns:
             Aggressive action (raise/call)
         """
-        import random
-
+        rng = self._rng
         player = game.current_player
 
         # Get available moves from the engine
         available_moves = game.get_available_moves()
 
         # 70% chance to raise if possible
-        if ActionType.RAISE in available_moves and random.random() < 0.7:
+        if ActionType.RAISE in available_moves and rng.random() < 0.7:
             # Raise between 2x and 3x the pot
             total_pot = sum(pot.amount for pot in game.pots)
-            min_raise = game.min_raise()
+            _, min_raise = engine_snapshot(game)
             max_raise = game.players[player].chips
-            raise_amount = min(max_raise, int(total_pot * random.uniform(2.0, 3.0)))
+            raise_amount = min(max_raise, int(total_pot * rng.uniform(2.0, 3.0)))
             raise_amount = max(raise_amount, min_raise)
             return ActionType.RAISE, raise_amount
 
@@ -139,8 +189,7 @@ class AgentManager:
         # Last resort - fold
         return ActionType.FOLD, 0
 
-    @staticmethod
-    def tight_agent(game: TexasHoldEm) -> Tuple[ActionType, int]:
+    def tight_agent(self, game: TexasHoldEm) -> Tuple[ActionType, int]:
         """
         Tight agent - folds often, only plays strong hands
 
@@ -150,8 +199,7 @@ class AgentManager:
         Returns:
             Conservative action
         """
-        import random
-
+        rng = self._rng
         player = game.current_player
 
         # Get available moves from the engine
@@ -163,14 +211,14 @@ class AgentManager:
 
         # 60% chance to fold if we have to call
         if ActionType.CALL in available_moves:
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 return ActionType.FOLD, 0
             else:
                 return ActionType.CALL, game.chips_to_call(player)
 
         # Rarely raise (20% chance)
-        if ActionType.RAISE in available_moves and random.random() < 0.2:
-            min_raise = game.min_raise()
+        if ActionType.RAISE in available_moves and rng.random() < 0.2:
+            _, min_raise = engine_snapshot(game)
             return ActionType.RAISE, min_raise
 
         # Default to fold
@@ -202,8 +250,8 @@ class AgentManager:
             self.register_agent(player_id, neural_agent)
 
         except ImportError as e:
-            print(f"⚠ Warning: Could not load neural agent: {e}")
-            print(f"   Falling back to random agent for player {player_id}")
+            logger.warning("Could not load neural agent: %s - falling back to random "
+                           "agent for player %d", e, player_id)
             self.register_agent(player_id, self.random_agent)
 
     def setup_neural_agents(self, num_players: int, human_player: int = 0,
@@ -222,39 +270,35 @@ class AgentManager:
             model_dir: Directory containing trained model files (default: model/)
             verbose: If True, log each neural network decision (useful for debugging)
         """
-        if model_dir is None:
-            # Default to model/ directory in project root
-            project_root = Path(__file__).parent.parent.parent
-            model_dir = project_root / "model"
-        else:
-            model_dir = Path(model_dir)
+        # Default to model/ directory in project root (resolved at import)
+        model_dir = _DEFAULT_MODEL_DIR if model_dir is None else Path(model_dir).resolve()
 
-        # Resolve to absolute path and verify it exists
-        model_dir = model_dir.resolve()
-        if not model_dir.exists():
-            print(f"⚠️  Warning: Model directory not found: {model_dir}")
-            print(f"   Creating directory...")
+        # One stat both verifies the directory exists and keys the scan cache
+        try:
+            mtime_ns = os.stat(model_dir).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("Model directory not found: %s - creating it", model_dir)
             model_dir.mkdir(parents=True, exist_ok=True)
+            mtime_ns = os.stat(model_dir).st_mtime_ns
 
-        print(f"\n📁 Model directory: {model_dir}")
-
-        # Find ALL available trained model files
-        all_model_files = list(model_dir.glob("poker_agent_*.pt"))
+        # Find ALL available trained model files (scan is cached per directory mtime)
+        buckets = _scan_models(str(model_dir), mtime_ns)
+        all_models = [(model_file, risk_profile)
+                      for risk_profile, files in buckets.items()
+                      for model_file in files]
 
-        if not all_model_files:
+        if not all_models:
             raise FileNotFoundError(f"No trained model files found in {model_dir}")
 
-        print(f"\n🎲 Found {len(all_model_files)} trained models:")
-        for model_file in all_model_files:
-            print(f"   • {model_file.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found %d trained models in %s: %s", len(all_models), model_dir,
+                         ", ".join(model_file.name for model_file, _ in all_models))
 
         # Generate random selection of models for AI players
         ai_player_count = num_players - 1  # Exclude human player
 
         # Randomly select models (with replacement, so same model can be used multiple times)
-        selected_models = random.choices(all_model_files, k=ai_player_count)
-
-        print(f"\n🎮 Setting up {ai_player_count} neural agents with randomly selected models:")
+        selected_indices = self._rng.choices(range(len(all_models)), k=ai_player_count)
 
         # Assign agents to players
         agent_index = 0
@@ -263,32 +307,26 @@ class AgentManager:
                 continue  # Skip human player
 
             # Get the randomly selected model for this player
-            model_file = selected_models[agent_index]
-            model_path = str(model_file.resolve())
-
-            # Extract risk profile from filename
-            # Pattern: poker_agent_{id}_{risk_profile}.pt
-            # Example: poker_agent_6_seeking.pt -> seeking
-            filename_parts = model_file.stem.split('_')
-            if len(filename_parts) >= 3:
-                risk_profile = filename_parts[-1]  # Last part is risk profile
-            else:
-                risk_profile = 'neutral'  # Fallback
+            model_file, risk_profile = all_models[selected_indices[agent_index]]
 
-            print(f"   Player {player_id}: {risk_profile:8s} <- {model_file.name}")
+            logger.debug("Player %d: %-8s <- %s", player_id, risk_profile, model_file.name)
 
             # Register neural agent
             self.register_neural_agent(
                 player_id=player_id,
-                model_path=model_path,
+                model_path=str(model_file),
                 risk_profile=risk_profile,
                 verbose=verbose
             )
 
             agent_index += 1
 
-        if verbose:
-            print(f"\n💡 Verbose mode enabled - neural network decisions will be logged during gameplay")
+        # One summary line per manager instead of a banner per agent
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Set up %d neural agents from %d models in %s (%s)%s",
+                        ai_player_count, len(all_models), model_dir,
+                        ", ".join(f"{len(files)} {risk}" for risk, files in buckets.items()),
+                        " - decisions logged at DEBUG" if verbose else "")
 
     def setup_default_agents(self, num_players: int, human_player: int = 0):
         """
@@ -5,12 +5,21 @@ This module provides an adapter that wraps trained PokerAgent models to work
 with the AgentManager interface in the poker.ev GUI.
 """
 
+import functools
+import logging
 import sys
 from pathlib import Path
+import numpy as np
 import torch
 from texasholdem import TexasHoldEm, ActionType
 from typing import Tuple
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    # onnxruntime is optional - without it agents run the PyTorch forward path
+    ort = None
+
 # Add model directory to path to import PokerAgent
 model_dir = Path(__file__).parent.parent.parent / "model"
 sys.path.insert(0, str(model_dir))
@@ -18,9 +27,331 @@ sys.path.insert(0, str(model_dir))
 from poker_agent import PokerAgent
 from poker_ev.agents.state_converter import (
     texasholdem_to_pokerenv_state,
-    create_mock_pokerenv_for_legal_actions
+    engine_snapshot,
+    MockPokerEnv,
+    STATE_DIM,
 )
 
+logger = logging.getLogger(__name__)
+
+# STATE_DIM (imported above) must match training (44 from PokerEnv.get_state)
+HIDDEN_DIM = 128
+
+# Keys every trained PokerAgent checkpoint should contain
+EXPECTED_STATE_DICT_KEYS = [
+    'fc1.weight', 'fc1.bias', 'fc2.weight', 'fc2.bias',
+    'action_head.weight', 'action_head.bias',
+    'raise_amount_head.weight', 'raise_amount_head.bias',
+    'value_head.weight', 'value_head.bias',
+]
+
+# PokerEnv action index -> TexasHoldEm ActionType (indices are contiguous 0..3)
+_ACTION_TABLE = (ActionType.FOLD, ActionType.CHECK, ActionType.CALL, ActionType.RAISE)
+
+# Actions to try, in order, when a RAISE cannot be made
+_FALLBACK_ORDER = (ActionType.CALL, ActionType.CHECK, ActionType.FOLD)
+
+# _validate_raise() result codes
+RAISE_OK = 0
+RAISE_BELOW_MIN = 1     # Not enough chips to meet the minimum raise
+RAISE_NOT_A_RAISE = 2   # Total bet would not exceed the highest bet
+
+# ONNX graph outputs, in PokerAgent.forward() order
+ONNX_OUTPUT_NAMES = ['logits', 'raise_logits', 'value']
+
+
+@functools.lru_cache(maxsize=None)
+def _load_state_dict(model_path: str, mtime_ns: int) -> dict:
+    """
+    Load a checkpoint's state dict once per resolved path and file version.
+
+    Args:
+        model_path: Resolved path to a .pt file
+        mtime_ns: The file's modification time, so a retrained file is reloaded
+
+    Returns:
+        dict: Model state dict
+    """
+    return torch.load(model_path, map_location='cpu', weights_only=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_model(model_path: str, mtime_ns: int, risk_profile: str) -> PokerAgent:
+    """
+    Build an eval-mode PokerAgent shared by every adapter using the same file.
+
+    Sharing is safe because inference keeps no per-decision state in the module.
+
+    Args:
+        model_path: Resolved path to a .pt file
+        mtime_ns: The file's modification time, so a retrained file is rebuilt
+        risk_profile: Risk profile ('neutral', 'averse', 'seeking')
+
+    Returns:
+        PokerAgent: Model with trained weights loaded
+    """
+    model = PokerAgent(
+        state_dim=STATE_DIM,
+        hidden_dim=HIDDEN_DIM,
+        risk_profile=risk_profile,
+        device='cpu'  # Use CPU for GUI (faster for single inference)
+    )
+
+    state_dict = _load_state_dict(model_path, mtime_ns)
+
+    # Verify state dict has expected keys
+    missing_keys = set(EXPECTED_STATE_DICT_KEYS) - set(state_dict.keys())
+    if missing_keys:
+        logger.warning("Missing keys in state dict: %s", missing_keys)
+
+    model.load_state_dict(state_dict)
+    model.eval()  # Set to evaluation mode
+    return model
+
+
+def _export_onnx(model: PokerAgent, onnx_path: Path):
+    """
+    Export a PokerAgent to ONNX for inference with onnxruntime.
+
+    Args:
+        model: PokerAgent with trained weights loaded
+        onnx_path: Destination .onnx file
+    """
+    dummy_state = torch.zeros(1, model.state_dim)
+    # TorchScript exporter: the dynamo one needs onnxscript and its graphs fail
+    # int8 quantization with a shape inference error
+    torch.onnx.export(
+        model,
+        dummy_state,
+        str(onnx_path),
+        opset_version=17,
+        input_names=['state'],
+        output_names=ONNX_OUTPUT_NAMES,
+        dynamic_axes={'state': {0: 'B'}},
+        dynamo=False
+    )
+
+
+def _quantize_onnx(onnx_path: Path, int8_path: Path) -> bool:
+    """
+    Quantize an exported model to int8 weights (dynamic activation quantization).
+
+    int8 weights cut weight traffic 4x and let onnxruntime dispatch to
+    VNNI/AVX2 integer dot products where the CPU supports them.
+
+    Args:
+        onnx_path: Source float32 .onnx file
+        int8_path: Destination quantized .onnx file
+
+    Returns:
+        True if the quantized model was written, False otherwise
+    """
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        quantize_dynamic(str(onnx_path), str(int8_path), weight_type=QuantType.QInt8)
+        return True
+    except Exception as e:
+        logger.warning("int8 quantization failed for %s: %s", onnx_path.name, e)
+        return False
+
+
+def _create_onnx_session(onnx_path: Path):
+    """
+    Create a single-threaded onnxruntime CPU session.
+
+    A 44-dim MLP is dispatch-bound, so one thread with full graph
+    optimization (Gemm+Bias+ReLU fusion) is the fastest configuration.
+
+    Args:
+        onnx_path: Path to exported .onnx file
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = 1
+    sess_options.inter_op_num_threads = 1
+    sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(str(onnx_path), sess_options, providers=['CPUExecutionProvider'])
+
+
+@functools.lru_cache(maxsize=None)
+def _build_onnx_session(model_path: str, mtime_ns: int, risk_profile: str):
+    """
+    Export a shared model to ONNX (once per .pt file) and open a session.
+
+    The .onnx file and its int8-quantized copy are written next to the
+    .pt file and regenerated only when the weights are newer than the
+    existing export. The int8 model is preferred; the float32 export is
+    used if quantization is unavailable.
+
+    Args:
+        model_path: Resolved path to a .pt file
+        mtime_ns: The file's modification time (keys the shared model)
+        risk_profile: Risk profile of the shared model
+
+    Returns:
+        onnxruntime.InferenceSession, or None if export/load failed
+    """
+    pt_path = Path(model_path)
+    onnx_path = pt_path.with_suffix('.onnx')
+    int8_path = pt_path.with_suffix('.int8.onnx')
+
+    try:
+        if not onnx_path.exists() or onnx_path.stat().st_mtime < pt_path.stat().st_mtime:
+            _export_onnx(_build_model(model_path, mtime_ns, risk_profile), onnx_path)
+
+        if not int8_path.exists() or int8_path.stat().st_mtime < onnx_path.stat().st_mtime:
+            if not _quantize_onnx(onnx_path, int8_path):
+                return _create_onnx_session(onnx_path)
+
+        return _create_onnx_session(int8_path)
+    except Exception as e:
+        logger.warning("ONNX export failed for %s: %s - neural agents using it will run "
+                       "the PyTorch model", pt_path.name, e)
+        return None
+
+
+def _legal_action_mask(env, player_id: int) -> np.ndarray:
+    """
+    NumPy port of PokerAgent.get_legal_actions().
+
+    Args:
+        env: PokerEnv-like object (active_players, bets, money)
+        player_id: Player index
+
+    Returns:
+        np.ndarray: Boolean mask of shape (4,) [fold, check, call, raise]
+    """
+    legal_mask = np.zeros(4, dtype=bool)
+
+    if not env.active_players[player_id]:
+        return legal_mask
+
+    highest_bet = max(env.bets) if any(env.bets) else 0
+    to_call = highest_bet - env.bets[player_id]
+    player_money = env.money[player_id]
+
+    legal_mask[0] = True
+    if to_call == 0 or player_money == 0:
+        legal_mask[1] = True
+    if to_call > 0 and player_money > 0:
+        legal_mask[2] = True
+    if max(player_money - to_call, 0) > 0:
+        legal_mask[3] = True
+
+    return legal_mask
+
+
+def _raise_amount_for_bucket(env, player_id: int, raise_bucket: int) -> int:
+    """
+    Convert a sampled raise bucket to chips (port of PokerAgent.get_raise_amount()).
+
+    Args:
+        env: PokerEnv-like object (bets, money, pot)
+        player_id: Player index
+        raise_bucket: 0=25% pot, 1=50% pot, 2=75% pot, 3=all-in
+
+    Returns:
+        int: Raise amount in chips
+    """
+    highest_bet = max(env.bets) if any(env.bets) else 0
+    to_call = highest_bet - env.bets[player_id]
+    max_raise_possible = max(env.money[player_id] - to_call, 0)
+    pot = env.pot
+
+    if max_raise_possible == 0:
+        return 0
+
+    if raise_bucket == 0:
+        raise_amount = max(int(0.25 * pot), 10)
+    elif raise_bucket == 1:
+        raise_amount = max(int(0.50 * pot), 20)
+    elif raise_bucket == 2:
+        raise_amount = max(int(0.75 * pot), 30)
+    else:
+        raise_amount = max(int(pot), max_raise_possible)
+
+    raise_amount = min(raise_amount, max_raise_possible)
+
+    if raise_amount == 0 and max_raise_possible > 0:
+        raise_amount = min(10, max_raise_possible)
+
+    return raise_amount
+
+
+def _validate_raise(raise_amount, highest_bet, current_bet, player_chips, min_raise):
+    """
+    Convert a raise amount to a TexasHoldEm total bet and validate it.
+
+    The model outputs a raise amount (how much to add on top of calling)
+    but TexasHoldEm expects total (the total bet amount to raise TO).
+
+    Args:
+        raise_amount: Positive raise amount from the model
+        highest_bet: Highest bet at the table
+        current_bet: This player's current bet
+        player_chips: This player's remaining chips
+        min_raise: Engine minimum raise
+
+    Returns:
+        Tuple[int, int]: (RAISE_* result code, total bet amount)
+    """
+    max_total_possible = current_bet + player_chips
+
+    # Clip to player's available chips
+    total_bet_amount = min(highest_bet + raise_amount, max_total_possible)
+
+    # Check if total bet meets minimum raise requirement
+    min_total_required = highest_bet + min_raise
+    if total_bet_amount < min_total_required:
+        # Try to meet minimum raise if we have enough chips
+        if max_total_possible >= min_total_required:
+            total_bet_amount = min_total_required
+        else:
+            return RAISE_BELOW_MIN, total_bet_amount
+
+    # Final validation: ensure we're actually raising
+    if total_bet_amount <= highest_bet:
+        return RAISE_NOT_A_RAISE, total_bet_amount
+
+    return RAISE_OK, total_bet_amount
+
+
+def _fallback(available) -> Tuple[ActionType, int]:
+    """
+    Pick the replacement for a RAISE that cannot be made.
+
+    Args:
+        available: Legal moves from game.get_available_moves()
+
+    Returns:
+        Tuple[ActionType, int]: First legal action from _FALLBACK_ORDER (FOLD if none, which
+                                prevents an infinite loop) with amount 0
+    """
+    for action in _FALLBACK_ORDER:
+        if action in available:
+            return action, 0
+    return ActionType.FOLD, 0
+
+
+def _sample_logits(logits: np.ndarray, rng: np.random.Generator) -> int:
+    """
+    Sample an index from softmax(logits); -inf entries get zero probability.
+
+    Args:
+        logits: 1-D logits array
+        rng: NumPy random generator
+
+    Returns:
+        int: Sampled index
+    """
+    probs = np.exp(logits - logits.max())
+    cumulative = np.cumsum(probs)
+    index = int(np.searchsorted(cumulative, rng.random() * cumulative[-1], side='right'))
+    return min(index, len(logits) - 1)
+
 
 class NeuralAgentAdapter:
     """
@@ -31,14 +362,6 @@ class NeuralAgentAdapter:
     (which uses TexasHoldEm library).
     """
 
-    # Map PokerEnv action indices to TexasHoldEm ActionType
-    ACTION_MAP = {
-        0: ActionType.FOLD,
-        1: ActionType.CHECK,
-        2: ActionType.CALL,
-        3: ActionType.RAISE,
-    }
-
     def __init__(self, model_path: str, player_id: int, risk_profile: str = 'neutral', verbose: bool = False):
         """
         Initialize the neural agent adapter.
@@ -54,52 +377,79 @@ class NeuralAgentAdapter:
         self.verbose = verbose
         self.decision_count = 0
 
-        # State dimension must match training (44 from PokerEnv.get_state)
-        state_dim = 44
-        hidden_dim = 128
+        # onnxruntime session (None = use PyTorch forward path)
+        self.session = None
+        self._rng = np.random.default_rng()
+
+        # Reused PokerEnv stand-in for legal action checks (synced each decision)
+        self._mock_env = MockPokerEnv()
 
-        # Create and load the trained model
-        self.model = PokerAgent(
-            state_dim=state_dim,
-            hidden_dim=hidden_dim,
-            risk_profile=risk_profile,
-            device='cpu'  # Use CPU for GUI (faster for single inference)
-        )
+        # Reused state vector buffer (written in place each decision)
+        self._state = np.empty(STATE_DIM, dtype=np.float32)
 
-        # Load trained weights
+        # Load trained weights (shared with other adapters using the same file)
         self.weights_loaded = False
-        from pathlib import Path
         model_path_obj = Path(model_path).resolve()
 
         try:
-            if not model_path_obj.exists():
-                raise FileNotFoundError(f"Model file does not exist: {model_path_obj}")
-
-            # Load the model weights
-            state_dict = torch.load(str(model_path_obj), map_location='cpu', weights_only=True)
-
-            # Verify state dict has expected keys
-            expected_keys = ['fc1.weight', 'fc1.bias', 'fc2.weight', 'fc2.bias',
-                           'action_head.weight', 'action_head.bias',
-                           'raise_amount_head.weight', 'raise_amount_head.bias',
-                           'value_head.weight', 'value_head.bias']
-            missing_keys = set(expected_keys) - set(state_dict.keys())
-            if missing_keys:
-                print(f"⚠️  Warning: Missing keys in state dict: {missing_keys}")
-
-            self.model.load_state_dict(state_dict)
-            self.model.eval()  # Set to evaluation mode
+            # The modification time keys the shared caches, so a retrained file is reloaded
+            mtime_ns = model_path_obj.stat().st_mtime_ns
+            self.model = _build_model(str(model_path_obj), mtime_ns, risk_profile)
             self.weights_loaded = True
-            print(f"✅ Loaded pretrained weights: {model_path_obj.name}")
-        except FileNotFoundError as e:
-            print(f"❌ Model file not found: {model_path_obj}")
-            print(f"   Neural agent for player {player_id} will use UNTRAINED weights")
-            print(f"   Expected location: {model_path_obj}")
+            logger.debug("Loaded pretrained weights: %s", model_path_obj.name)
+        except FileNotFoundError:
+            logger.warning("Model file not found: %s - neural agent for player %d "
+                           "will use UNTRAINED weights", model_path_obj, player_id)
         except Exception as e:
-            print(f"❌ Error loading model {model_path_obj.name}: {e}")
-            print(f"   Neural agent for player {player_id} will use UNTRAINED weights")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Error loading model %s: %s - neural agent for player %d "
+                           "will use UNTRAINED weights", model_path_obj.name, e, player_id,
+                           exc_info=True)
+
+        if not self.weights_loaded:
+            # Untrained models are per-adapter so nothing mutates a shared module
+            self.model = PokerAgent(
+                state_dim=STATE_DIM,
+                hidden_dim=HIDDEN_DIM,
+                risk_profile=risk_profile,
+                device='cpu'
+            )
+        elif ort is not None:
+            self.session = _build_onnx_session(str(model_path_obj), mtime_ns, risk_profile)
+
+        # (1, STATE_DIM) view of the state buffer for the PyTorch forward path,
+        # so no copy per decision (None = untrained model, use PokerAgent.act())
+        self._state_tensor = None
+        if self.weights_loaded and self.session is None:
+            self._state_tensor = torch.from_numpy(self._state).unsqueeze(0)
+
+    def _select_action(self, logits: np.ndarray, raise_logits: np.ndarray, env) -> Tuple[int, int]:
+        """
+        Select an action from network outputs (mirrors PokerAgent.act()).
+
+        Args:
+            logits: Action logits, shape (4,)
+            raise_logits: Raise bucket logits, shape (4,)
+            env: PokerEnv-like object for legal action checking
+
+        Returns:
+            Tuple[int, int]: (action index, raise amount)
+        """
+        legal_mask = _legal_action_mask(env, self.player_id)
+        if not legal_mask.any():
+            return 0, 0
+
+        masked_logits = np.where(legal_mask, logits, -np.inf)
+        if not np.isfinite(masked_logits.max()):
+            return 0, 0
+
+        action_idx = _sample_logits(masked_logits, self._rng)
+
+        raise_amount = 0
+        if action_idx == 3:
+            raise_bucket = _sample_logits(raise_logits, self._rng)
+            raise_amount = _raise_amount_for_bucket(env, self.player_id, raise_bucket)
+
+        return action_idx, raise_amount
 
     def __call__(self, game: TexasHoldEm) -> Tuple[ActionType, int]:
         """
@@ -116,112 +466,70 @@ class NeuralAgentAdapter:
                 - amount: Raise amount (0 if not raising)
         """
         # Convert game state to PokerEnv format (44-dim vector)
-        state = texasholdem_to_pokerenv_state(game, self.player_id)
+        state = texasholdem_to_pokerenv_state(game, self.player_id, self._state)
 
-        # Create mock PokerEnv for legal action checking
-        mock_env = create_mock_pokerenv_for_legal_actions(game, self.player_id)
+        # Sync the pooled mock PokerEnv for legal action checking
+        mock_env = self._mock_env.sync(game, self.player_id)
 
         # Get action from model
-        with torch.no_grad():
-            action_idx, raise_amount, _, _ = self.model.act(
-                state=state,
-                env=mock_env,
-                player_id=self.player_id
+        if self.session is not None:
+            logits, raise_logits, _ = self.session.run(ONNX_OUTPUT_NAMES, {'state': state[None]})
+            action_idx, raise_amount = self._select_action(logits[0], raise_logits[0], mock_env)
+        elif self._state_tensor is not None:
+            with torch.inference_mode():
+                logits, raise_logits, _ = self.model(self._state_tensor)
+            action_idx, raise_amount = self._select_action(
+                logits[0].numpy(), raise_logits[0].numpy(), mock_env
             )
+        else:
+            with torch.no_grad():
+                action_idx, raise_amount, _, _ = self.model.act(
+                    state=state,
+                    env=mock_env,
+                    player_id=self.player_id
+                )
 
         # Track decision count
         self.decision_count += 1
 
         # Convert PokerEnv action index to TexasHoldEm ActionType
-        action = self.ACTION_MAP[action_idx]
+        action = _ACTION_TABLE[action_idx]
 
         # Log neural network decision if verbose
         if self.verbose:
-            print(f"[NN Player {self.player_id} ({self.risk_profile})]: Decision #{self.decision_count} → {action.name}")
+            logger.debug("[NN Player %d (%s)]: Decision #%d -> %s", self.player_id,
+                         self.risk_profile, self.decision_count, action.name)
 
         # Handle raise action
-        if action == ActionType.RAISE:
-            # Defensive check: if raise amount is invalid, fall back to CALL/CHECK
-            if raise_amount is None or raise_amount <= 0:
-                # Get available actions from the game
-                available_actions = game.get_available_moves()
-
-                # Try to fall back to CALL if available, otherwise CHECK
-                if ActionType.CALL in available_actions:
-                    action = ActionType.CALL
-                    amount = 0
-                elif ActionType.CHECK in available_actions:
-                    action = ActionType.CHECK
-                    amount = 0
-                else:
-                    # Last resort: FOLD (should not happen, but prevents infinite loop)
-                    action = ActionType.FOLD
-                    amount = 0
-
-                print(f"⚠ Warning: Neural agent selected RAISE with invalid amount {raise_amount}, "
-                      f"falling back to {action}")
-            else:
-                # Convert raise_amount to total bet amount for TexasHoldEm
-                # The model outputs a raise amount (how much to add on top of calling)
-                # but TexasHoldEm expects total (the total bet amount to raise TO)
-                highest_bet = max(game.player_bet_amount(i) for i in range(len(game.players)))
-                total_bet_amount = highest_bet + raise_amount
-
-                # Ensure total bet amount is valid
-                player_chips = game.players[self.player_id].chips
-                current_bet = game.player_bet_amount(self.player_id)
-                max_total_possible = current_bet + player_chips
-
-                # Clip to player's available chips
-                total_bet_amount = min(total_bet_amount, max_total_possible)
-
-                # Get minimum raise requirement from the game
-                min_raise = game.min_raise()
-                min_total_required = highest_bet + min_raise
-
-                # Check if total bet meets minimum raise requirement
-                if total_bet_amount < min_total_required:
-                    # Try to meet minimum raise if we have enough chips
-                    if max_total_possible >= min_total_required:
-                        # Adjust to meet minimum raise
-                        total_bet_amount = min_total_required
-                    else:
-                        # Can't meet minimum raise, fall back to CALL/CHECK
-                        available_actions = game.get_available_moves()
-                        if ActionType.CALL in available_actions:
-                            action = ActionType.CALL
-                            amount = 0
-                        elif ActionType.CHECK in available_actions:
-                            action = ActionType.CHECK
-                            amount = 0
-                        else:
-                            action = ActionType.FOLD
-                            amount = 0
-                        print(f"⚠ Warning: Neural agent cannot meet min_raise={min_raise} "
-                              f"(has {max_total_possible - highest_bet} available), "
-                              f"falling back to {action}")
-                        return action, amount
-
-                # Final validation: ensure we're actually raising
-                if total_bet_amount <= highest_bet:
-                    # Can't raise, fall back to CALL/CHECK
-                    available_actions = game.get_available_moves()
-                    if ActionType.CALL in available_actions:
-                        action = ActionType.CALL
-                        amount = 0
-                    elif ActionType.CHECK in available_actions:
-                        action = ActionType.CHECK
-                        amount = 0
-                    else:
-                        action = ActionType.FOLD
-                        amount = 0
-                    print(f"⚠ Warning: Neural agent RAISE amount too small (total={total_bet_amount}, "
-                          f"highest={highest_bet}), falling back to {action}")
-                else:
-                    amount = total_bet_amount
+        if action != ActionType.RAISE:
+            return action, 0
+
+        # Defensive check: if raise amount is invalid, fall back to CALL/CHECK
+        if raise_amount is None or raise_amount <= 0:
+            reason = f"Neural agent selected RAISE with invalid amount {raise_amount}"
         else:
-            amount = 0
+            # Round-level values are cached per betting action; the rest is per player
+            highest_bet, min_raise = engine_snapshot(game)
+            current_bet = game.player_bet_amount(self.player_id)
+            player_chips = game.players[self.player_id].chips
+
+            result, total_bet_amount = _validate_raise(
+                int(raise_amount), highest_bet, current_bet, player_chips, min_raise
+            )
+
+            if result == RAISE_OK:
+                return action, int(total_bet_amount)
+
+            if result == RAISE_BELOW_MIN:
+                reason = (f"Neural agent cannot meet min_raise={min_raise} "
+                          f"(has {current_bet + player_chips - highest_bet} available)")
+            else:
+                reason = (f"Neural agent RAISE amount too small (total={total_bet_amount}, "
+                          f"highest={highest_bet})")
 
+        # Can't raise: query the engine's legal moves once (only on this path)
+        action, amount = _fallback(game.get_available_moves())
+        logger.warning("%s, falling back to %s", reason, action)
         return action, amount
 
 
@@ -5,14 +5,24 @@ This module provides utilities to convert game state from the texasholdem librar
 to the 44-dimensional state vector format used by the trained neural network models.
 """
 
+import weakref
 import numpy as np
 from texasholdem import TexasHoldEm, Card, PlayerState
-from typing import List
+from typing import List, Optional, Tuple
 
 
 # Maximum number of players supported by PokerEnv
 MAX_NUM_PLAYERS = 9
 
+# Length of the PokerEnv state vector (see texasholdem_to_pokerenv_state)
+STATE_DIM = 44
+
+# Player states that count as not active in the hand (folded or out of the game)
+_INACTIVE = frozenset((PlayerState.SKIP, PlayerState.OUT))
+
+# Per-game (action_key, highest_bet, min_raise), held weakly so finished games are freed
+_BETTING_CACHE: "weakref.WeakKeyDictionary[TexasHoldEm, tuple]" = weakref.WeakKeyDictionary()
+
 
 def convert_card_to_tuple(card: Card) -> tuple:
     """
@@ -30,33 +40,24 @@ def convert_card_to_tuple(card: Card) -> tuple:
         texasholdem uses rank 0-12 (0=2, 12=A) and suit 1,2,4,8 (binary flags)
         PokerEnv uses rank 2-14 and suit 1,2,3,4
     """
-    # Convert rank: texasholdem 0-12 -> PokerEnv 2-14
-    rank = card.rank + 2
+    # Rank: texasholdem 0-12 -> PokerEnv 2-14
+    # Suit: the flags are powers of two, so bit_length() maps 1,2,4,8 -> 1,2,3,4
+    return (card.rank + 2, card.suit.bit_length())
 
-    # Convert suit: texasholdem binary flags -> PokerEnv 1,2,3,4
-    # texasholdem: 1=spade, 2=heart, 4=diamond, 8=club
-    # PokerEnv: 1=spade, 2=heart, 3=diamond, 4=club
-    suit_map = {
-        1: 1,  # Spade
-        2: 2,  # Heart
-        4: 3,  # Diamond
-        8: 4,  # Club
-    }
-    suit = suit_map.get(card.suit, 1)
 
-    return (rank, suit)
-
-
-def texasholdem_to_pokerenv_state(game: TexasHoldEm, player_id: int) -> np.ndarray:
+def texasholdem_to_pokerenv_state(game: TexasHoldEm, player_id: int,
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Convert TexasHoldEm game state to 44-dimensional state vector for neural network.
 
     Args:
         game: TexasHoldEm game instance
         player_id: ID of the player to generate state for
+        out: Optional preallocated float32 array of shape (44,) to write into
+             (e.g. a row of a batch buffer); a new array is allocated if None
 
     Returns:
-        np.ndarray: 44-dimensional state vector matching PokerEnv.get_state() format:
+        np.ndarray: 44-dimensional state vector (``out`` if given) matching PokerEnv.get_state() format:
             - ranks[0:7]: card ranks (hand + community, padded to 7)
             - suits[7:14]: card suits (hand + community, padded to 7)
             - player_id[14]: current player ID
@@ -72,66 +73,155 @@ def texasholdem_to_pokerenv_state(game: TexasHoldEm, player_id: int) -> np.ndarr
     # Get community cards
     community_cards = game.board if game.is_hand_running() else []
 
-    # Convert cards to (rank, suit) tuples
-    hand_tuples = [convert_card_to_tuple(card) for card in player_hand]
-    community_tuples = [convert_card_to_tuple(card) for card in community_cards]
+    # Write straight into one zeroed 44-dim buffer; unused slots are the padding
+    if out is None:
+        state = np.zeros(STATE_DIM, dtype=np.float32)
+    else:
+        state = out
+        state.fill(0)
 
     # Combine hand and community cards
-    all_cards = hand_tuples + community_tuples
+    all_cards = list(player_hand) + list(community_cards)
+    num_cards = len(all_cards)
+
+    # ranks[0:7] and suits[7:14] (same mapping as convert_card_to_tuple)
+    state[0:num_cards] = [card.rank + 2 for card in all_cards]
+    state[7:7 + num_cards] = [card.suit.bit_length() for card in all_cards]
 
-    # Extract ranks and suits, pad to 7 cards total
-    ranks = [card[0] for card in all_cards] + [0] * (7 - len(all_cards))
-    suits = [card[1] for card in all_cards] + [0] * (7 - len(all_cards))
+    # player_id[14]
+    state[14] = player_id
 
-    # Get active players (players who haven't folded)
+    # active_players[15:24] (players who haven't folded)
     num_players = len(game.players)
-    active_players = []
-    for i in range(num_players):
-        player = game.players[i]
-        is_active = (player.state != PlayerState.SKIP and
-                    player.state != PlayerState.OUT)
-        active_players.append(1 if is_active else 0)
+    state[15:15 + num_players] = [player.state not in _INACTIVE for player in game.players]
 
-    # Pad active_players to MAX_NUM_PLAYERS
-    active_players += [0] * (MAX_NUM_PLAYERS - len(active_players))
+    # Query each player's bet once; pot, current bet and bets all reuse it
+    player_bet_amount = game.player_bet_amount
+    bets = [player_bet_amount(i) for i in range(num_players)]
 
-    # Calculate total pot
-    total_pot = sum(pot.amount for pot in game.pots)
-    # Add current round bets to pot
-    total_pot += sum(game.player_bet_amount(i) for i in range(num_players))
+    # pot[24]: total pot plus current round bets
+    state[24] = sum(pot.amount for pot in game.pots) + sum(bets)
 
-    # Get current bet for this player
-    current_bet = game.player_bet_amount(player_id)
+    # current_bet[25] for this player
+    state[25] = bets[player_id]
 
-    # Get all player bets
-    bets = [game.player_bet_amount(i) for i in range(num_players)]
-    bets += [0] * (MAX_NUM_PLAYERS - len(bets))
+    # bets[26:35] and money[35:44]
+    state[26:26 + num_players] = bets
+    state[35:35 + num_players] = [player.chips for player in game.players]
 
-    # Get all player chip stacks
-    money = [game.players[i].chips for i in range(num_players)]
-    money += [0] * (MAX_NUM_PLAYERS - len(money))
+    return state
 
-    # Build state vector (44 dimensions total)
-    state = (ranks +                    # 7 elements
-             suits +                     # 7 elements
-             [player_id] +               # 1 element
-             active_players +            # 9 elements (MAX_NUM_PLAYERS)
-             [total_pot, current_bet] +  # 2 elements
-             bets +                      # 9 elements (MAX_NUM_PLAYERS)
-             money)                      # 9 elements (MAX_NUM_PLAYERS)
 
-    return np.array(state, dtype=np.float32)
+def _action_key(game: TexasHoldEm) -> Optional[tuple]:
+    """
+    Key that advances whenever a betting action is taken.
+
+    Returns None if the game does not expose a hand history (e.g. test doubles),
+    in which case callers should not cache.
+    """
+    try:
+        hand_phase = game.hand_phase
+        return game.num_hands, hand_phase, len(game.hand_history[hand_phase].actions)
+    except (AttributeError, KeyError, TypeError):
+        return None
 
 
-def create_mock_pokerenv_for_legal_actions(game: TexasHoldEm, player_id: int):
+def engine_snapshot(game: TexasHoldEm) -> Tuple[int, int]:
     """
-    Create a minimal mock PokerEnv-like object for legal action checking.
+    Get the betting-round values needed for raise math.
+
+    Both values only change when a player acts, so they are cached per game
+    and reused until the hand, phase or number of actions in the phase changes.
+
+    Args:
+        game: TexasHoldEm game instance
+
+    Returns:
+        tuple: (highest_bet, min_raise) where highest_bet is the largest bet
+               any player has made in the current betting round
+    """
+    key = _action_key(game)
+    if key is not None:
+        try:
+            cached = _BETTING_CACHE.get(game)
+        except TypeError:
+            # Game object does not support weak references
+            key = cached = None
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+    bet_of = game.player_bet_amount
+    highest_bet = max(map(bet_of, range(len(game.players))))
+    min_raise = game.min_raise()
+
+    if key is not None:
+        _BETTING_CACHE[game] = (key, highest_bet, min_raise)
+
+    return highest_bet, min_raise
+
+
+class MockPokerEnv:
+    """
+    Minimal PokerEnv-like object for legal action checking.
 
     The PokerAgent.get_legal_actions() method needs access to:
     - active_players
     - bets
     - money
 
+    Instances are meant to be reused: sync() overwrites the fields in
+    place so a long-lived agent does not allocate a new env per decision.
+    """
+
+    __slots__ = ('active_players', 'bets', 'money', 'pot')
+
+    def __init__(self):
+        self.active_players: List[bool] = []
+        self.bets: List[int] = []
+        self.money: List[int] = []
+        self.pot = 0
+
+    def sync(self, game: TexasHoldEm, player_id: int) -> 'MockPokerEnv':
+        """
+        Overwrite this env's fields from the current game state.
+
+        Args:
+            game: TexasHoldEm game instance
+            player_id: Player ID
+
+        Returns:
+            self (for chaining)
+        """
+        players = game.players
+        num_players = len(players)
+
+        # Resize buffers only when the table size changes
+        if len(self.bets) != num_players:
+            self.active_players = [False] * num_players
+            self.bets = [0] * num_players
+            self.money = [0] * num_players
+
+        active_players = self.active_players
+        bets = self.bets
+        money = self.money
+        player_bet_amount = game.player_bet_amount
+
+        for i in range(num_players):
+            player = players[i]
+            active_players[i] = player.state not in _INACTIVE
+            bets[i] = player_bet_amount(i)
+            money[i] = player.chips
+
+        # Pot (including current round bets)
+        self.pot = sum(pot.amount for pot in game.pots) + sum(bets)
+
+        return self
+
+
+def create_mock_pokerenv_for_legal_actions(game: TexasHoldEm, player_id: int) -> MockPokerEnv:
+    """
+    Create a minimal mock PokerEnv-like object for legal action checking.
+
     Args:
         game: TexasHoldEm game instance
         player_id: Player ID
@@ -139,26 +229,4 @@ def create_mock_pokerenv_for_legal_actions(game: TexasHoldEm, player_id: int):
     Returns:
         Mock object with PokerEnv-compatible attributes
     """
-    class MockPokerEnv:
-        def __init__(self):
-            num_players = len(game.players)
-
-            # Active players
-            self.active_players = []
-            for i in range(num_players):
-                player = game.players[i]
-                is_active = (player.state != PlayerState.SKIP and
-                           player.state != PlayerState.OUT)
-                self.active_players.append(is_active)
-
-            # Player bets
-            self.bets = [game.player_bet_amount(i) for i in range(num_players)]
-
-            # Player chip stacks
-            self.money = [game.players[i].chips for i in range(num_players)]
-
-            # Pot
-            self.pot = sum(pot.amount for pot in game.pots)
-            self.pot += sum(game.player_bet_amount(i) for i in range(num_players))
-
-    return MockPokerEnv()
+    return MockPokerEnv().sync(game, player_id)
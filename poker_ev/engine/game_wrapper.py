@@ -8,6 +8,10 @@ from texasholdem import TexasHoldEm, Card, ActionType, HandPhase, PlayerState
 from typing import List, Dict, Optional, Tuple
 
 
+# Player states that count as not active in the hand (folded or out of the game)
+_INACTIVE = frozenset((PlayerState.SKIP, PlayerState.OUT))
+
+
 class PokerGame:
     """
     Wrapper around texasholdem.TexasHoldEm with GUI-friendly interface
@@ -39,6 +43,11 @@ class PokerGame:
             max_players=num_players
         )
 
+        # get_game_state() result, reused until an action/new hand/reset bumps the version
+        self._state_version = 0
+        self._cached_version = -1
+        self._cached_state: Optional[Dict] = None
+
     def start_new_hand(self) -> bool:
         """
         Start a new hand
@@ -46,6 +55,7 @@ class PokerGame:
         Returns:
             True if hand started successfully, False otherwise
         """
+        self._state_version += 1
         try:
             self.engine.start_hand()
             return True
@@ -57,6 +67,22 @@ class PokerGame:
         """
         Get complete game state for rendering
 
+        The state only changes through take_action(), start_new_hand() and
+        reset_game(), so it is built once per change and the same dict is
+        returned until then. Callers must treat it as read-only.
+
+        Returns:
+            Dictionary containing all relevant game state information
+        """
+        if self._cached_version != self._state_version:
+            self._cached_state = self._build_game_state()
+            self._cached_version = self._state_version
+        return self._cached_state
+
+    def _build_game_state(self) -> Dict:
+        """
+        Build the game state dictionary from the engine
+
         Returns:
             Dictionary containing all relevant game state information
         """
@@ -74,10 +100,13 @@ class PokerGame:
 
         current = self.engine.current_player
 
+        # Query each player's bet once (used for the pot and the player states)
+        player_bet_amount = self.engine.player_bet_amount
+        bets = [player_bet_amount(i) for i in range(len(self.engine.players))]
+
         # Calculate total pot from all pots plus player bets
-        total_pot = sum(pot.amount for pot in self.engine.pots)
-        # Add all current player bets (blinds and current round bets)
-        total_pot += sum(self.engine.player_bet_amount(i) for i in range(len(self.engine.players)))
+        # (blinds and current round bets)
+        total_pot = sum(pot.amount for pot in self.engine.pots) + sum(bets)
 
         return {
             'hand_active': True,
@@ -85,16 +114,19 @@ class PokerGame:
             'hand_phase': self.engine.hand_phase,
             'board': self.engine.board,
             'pot': total_pot,
-            'players': self._get_player_states(),
+            'players': self._get_player_states(bets),
             'valid_actions': self._get_valid_actions(),
             'chips_to_call': self.engine.chips_to_call(current) if current is not None else 0,
             'min_raise': self._get_min_raise(),
         }
 
-    def _get_player_states(self) -> List[Dict]:
+    def _get_player_states(self, bets: Optional[List[int]] = None) -> List[Dict]:
         """
         Get state for all players
 
+        Args:
+            bets: Optional per-player bet amounts already queried from the engine
+
         Returns:
             List of player state dictionaries
         """
@@ -109,8 +141,9 @@ class PokerGame:
             player = self.engine.players[player_id]
 
             # Check if player is in current hand (not folded or out)
-            is_active = player.state != PlayerState.SKIP and player.state != PlayerState.OUT
-            is_folded = player.state == PlayerState.SKIP
+            state = player.state
+            is_active = state not in _INACTIVE
+            is_folded = state == PlayerState.SKIP
 
             if not is_active:
                 states.append({
@@ -126,10 +159,10 @@ class PokerGame:
                 'in_game': True,
                 'id': player_id,
                 'chips': player.chips,
-                'bet': self.engine.player_bet_amount(player_id),
+                'bet': bets[player_id] if bets is not None else self.engine.player_bet_amount(player_id),
                 'hand': self.engine.get_hand(player_id) if self.engine.is_hand_running() else [],
                 'folded': is_folded,
-                'all_in': player.state == PlayerState.ALL_IN,
+                'all_in': state == PlayerState.ALL_IN,
             })
 
         return states
@@ -188,6 +221,7 @@ class PokerGame:
         Returns:
             True if action was successful, False otherwise
         """
+        self._state_version += 1
         try:
             if action == ActionType.RAISE:
                 self.engine.take_action(action, total=amount)
@@ -214,6 +248,7 @@ class PokerGame:
 
     def reset_game(self):
         """Reset the game to initial state with fresh chips"""
+        self._state_version += 1
         self.engine = TexasHoldEm(
             buyin=self.buyin,
             big_blind=self.big_blind,
@@ -7,6 +7,11 @@ from texasholdem import Card
 from typing import Dict, Optional
 
 
+# Sprite name per card: texasholdem cards are ints, so the 52 names are
+# computed once on first use and then looked up directly
+_SPRITE_NAME_CACHE: Dict[int, str] = {}
+
+
 class CardRenderer:
     """
     Convert texasholdem Card objects to pyker sprites
@@ -40,6 +45,20 @@ class CardRenderer:
         """
         self.card_sprites = card_sprites
 
+        # Sprite per card int value for all 52 cards, so drawing a card is one
+        # dict lookup (missing sprites are left out and reported on use)
+        self._by_int: Dict[int, pygame.Surface] = {}
+        for rank in '23456789TJQKA':
+            for suit in 'shdc':
+                card = Card(rank + suit)
+                sprite = card_sprites.get(self.card_to_sprite_name(card))
+                if sprite is not None:
+                    self._by_int[int(card)] = sprite
+
+        # Scaled copies keyed by (card int or sprite name, (width, height)); card
+        # sprites never change, so each size is scaled once instead of every frame
+        self._scale_cache: Dict[tuple, pygame.Surface] = {}
+
     def card_to_sprite_name(self, card: Card) -> str:
         """
         Convert texasholdem Card to pyker sprite name
@@ -55,6 +74,10 @@ class CardRenderer:
             Card("2s") → "2S"
             Card("10h") → "10H"
         """
+        name = _SPRITE_NAME_CACHE.get(card)
+        if name is not None:
+            return name
+
         rank_str = self.RANK_MAP[card.rank]
 
         # Get suit - card.suit is an integer bit flag
@@ -64,7 +87,8 @@ class CardRenderer:
         if suit_str is None:
             raise ValueError(f"Unknown suit value: {suit_int}")
 
-        return f"{rank_str}{suit_str}"
+        name = _SPRITE_NAME_CACHE[card] = f"{rank_str}{suit_str}"
+        return name
 
     def get_card_sprite(self, card: Card, scale: Optional[tuple] = None) -> Optional[pygame.Surface]:
         """
@@ -77,15 +101,14 @@ class CardRenderer:
         Returns:
             pygame Surface for the card, or None if not found
         """
-        sprite_name = self.card_to_sprite_name(card)
-        sprite = self.card_sprites.get(sprite_name)
+        sprite = self._by_int.get(card)
 
         if sprite is None:
-            print(f"Warning: Card sprite '{sprite_name}' not found")
+            print(f"Warning: Card sprite '{self.card_to_sprite_name(card)}' not found")
             return None
 
         if scale is not None:
-            sprite = pygame.transform.scale(sprite, scale)
+            sprite = self._scaled(card, sprite, scale)
 
         return sprite
 
@@ -106,10 +129,28 @@ class CardRenderer:
             return None
 
         if scale is not None:
-            sprite = pygame.transform.scale(sprite, scale)
+            sprite = self._scaled("back_red", sprite, scale)
 
         return sprite
 
+    def _scaled(self, sprite_key, sprite: pygame.Surface, scale: tuple) -> pygame.Surface:
+        """
+        Get a scaled copy of a sprite, scaling it only the first time a size is requested
+
+        Args:
+            sprite_key: Card int value, or sprite name for non-card sprites
+            sprite: The unscaled sprite
+            scale: (width, height) to scale to
+
+        Returns:
+            Cached scaled pygame Surface (shared - callers must not draw onto it)
+        """
+        key = (sprite_key, tuple(scale))
+        scaled = self._scale_cache.get(key)
+        if scaled is None:
+            scaled = self._scale_cache[key] = pygame.transform.scale(sprite, scale)
+        return scaled
+
     def get_cards_sprites(self, cards: list, scale: Optional[tuple] = None) -> list:
         """
         Get sprites for multiple cards
@@ -122,3 +163,23 @@ class CardRenderer:
             List of pygame Surfaces
         """
         return [self.get_card_sprite(card, scale) for card in cards]
+
+    def blit_cards(self, screen: pygame.Surface, cards: list, positions: list,
+                   scale: Optional[tuple] = None, face_up: bool = True):
+        """
+        Draw multiple cards with a single Surface.blits() call
+
+        Args:
+            screen: Surface to draw on
+            cards: List of texasholdem Card objects
+            positions: (x, y) top-left position for each card
+            scale: Optional (width, height) to scale sprites
+            face_up: If False, draw the card back for every card instead
+        """
+        if face_up:
+            sprites = [self.get_card_sprite(card, scale) for card in cards]
+        else:
+            sprites = [self.get_card_back(scale)] * len(cards)
+
+        screen.blits([(sprite, position) for sprite, position in zip(sprites, positions)
+                      if sprite is not None], doreturn=False)
@@ -4,8 +4,19 @@ Chat Input for retro chat UI
 Text input field with blinking cursor and retro styling.
 """
 
+import bisect
+import time
+from itertools import accumulate
+
 import pygame
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable
+
+
+def _is_printable(text: str) -> bool:
+    """Check if typed text can be inserted (fast path for single printable ASCII characters)"""
+    if len(text) == 1 and ' ' <= text <= '~':
+        return True
+    return bool(text) and text.isprintable()
 
 
 class ChatInput:
@@ -46,17 +57,65 @@ class ChatInput:
         self.prompt = "> "
         self.prompt_width = self.font.size(self.prompt)[0]
 
+        # Prompt and placeholder never change, so render them once
+        self._prompt_surface = self.font.render(self.prompt, True, self.TEXT_COLOR)
+        self._placeholder_surface = self.font.render(self.placeholder, True, self.PLACEHOLDER_COLOR)
+
+        # Rendered text, re-rendered only after the text changes (None = dirty)
+        self._text_surface: Optional[pygame.Surface] = None
+
+        # Text is a gap buffer split at the cursor: _before holds the characters
+        # before it, _after the characters after it in reverse order, so typing
+        # and deleting at the cursor are O(1) list operations
+        self._before: List[str] = []
+        self._after: List[str] = []
+        self._text: Optional[str] = ""  # Joined text, None until next needed
+
         # State
-        self.text = ""
         self.is_active = False
-        self.cursor_pos = 0  # Character position of cursor
         self.cursor_visible = True
-        self.cursor_timer = 0
-        self.cursor_blink_rate = 30  # Frames per blink
+        self.cursor_blink_interval = 0.5  # Seconds per blink phase (independent of frame rate)
 
         # Scroll offset for long text
         self.scroll_offset = 0
 
+        # _prefix_widths[i] is the pixel width of self.text[:i], kept in step with
+        # every edit so cursor/scroll math never re-measures the text
+        self._glyph_widths: Dict[str, int] = {}
+        self._prefix_widths: List[int] = [0]
+
+    @property
+    def text(self) -> str:
+        """Current input text"""
+        if self._text is None:
+            self._text = ''.join(self._before) + ''.join(reversed(self._after))
+        return self._text
+
+    @text.setter
+    def text(self, value: str):
+        self._before = list(value)
+        self._after = []
+        self._changed()
+        self._rebuild_widths()
+
+    @property
+    def cursor_pos(self) -> int:
+        """Character position of cursor"""
+        return len(self._before)
+
+    @cursor_pos.setter
+    def cursor_pos(self, pos: int):
+        before, after = self._before, self._after
+        while len(before) > pos and before:
+            after.append(before.pop())
+        while len(before) < pos and after:
+            before.append(after.pop())
+
+    def _changed(self):
+        """Invalidate the joined text and its rendered surface after an edit"""
+        self._text = None
+        self._text_surface = None
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle pygame events
@@ -103,30 +162,33 @@ class ChatInput:
 
         elif event.key == pygame.K_BACKSPACE:
             # Delete character before cursor
-            if self.cursor_pos > 0:
-                self.text = self.text[:self.cursor_pos - 1] + self.text[self.cursor_pos:]
-                self.cursor_pos -= 1
+            if self._before:
+                self._before.pop()
+                self._changed()
+                self._remove_width(self.cursor_pos)
                 self._update_scroll()
             return True
 
         elif event.key == pygame.K_DELETE:
             # Delete character after cursor
-            if self.cursor_pos < len(self.text):
-                self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos + 1:]
+            if self._after:
+                self._after.pop()
+                self._changed()
+                self._remove_width(self.cursor_pos)
                 self._update_scroll()
             return True
 
         elif event.key == pygame.K_LEFT:
             # Move cursor left
-            if self.cursor_pos > 0:
-                self.cursor_pos -= 1
+            if self._before:
+                self._after.append(self._before.pop())
                 self._update_scroll()
             return True
 
         elif event.key == pygame.K_RIGHT:
             # Move cursor right
-            if self.cursor_pos < len(self.text):
-                self.cursor_pos += 1
+            if self._after:
+                self._before.append(self._after.pop())
                 self._update_scroll()
             return True
 
@@ -138,14 +200,16 @@ class ChatInput:
 
         elif event.key == pygame.K_END:
             # Move cursor to end
-            self.cursor_pos = len(self.text)
+            self.cursor_pos = len(self._before) + len(self._after)
             self._update_scroll()
             return True
 
-        elif event.unicode and event.unicode.isprintable():
-            # Insert character at cursor
-            self.text = self.text[:self.cursor_pos] + event.unicode + self.text[self.cursor_pos:]
-            self.cursor_pos += 1
+        elif _is_printable(event.unicode):
+            # Insert character(s) at cursor
+            for char in event.unicode:
+                self._insert_width(self.cursor_pos, char)
+                self._before.append(char)
+            self._changed()
             self._update_scroll()
             return True
 
@@ -156,26 +220,46 @@ class ChatInput:
         # Calculate which character was clicked (accounting for prompt)
         relative_x = mouse_pos[0] - self.rect.left - 10 - self.prompt_width + self.scroll_offset
 
-        # Find closest character position
-        for i in range(len(self.text) + 1):
-            text_before = self.text[:i]
-            width = self.font.size(text_before)[0]
-
-            if width >= relative_x:
-                self.cursor_pos = max(0, i - 1) if i > 0 else 0
-                return
-
-        self.cursor_pos = len(self.text)
+        # Binary search for the first character boundary at or past the click;
+        # the cursor goes just before it (at most len(text) when past the end)
+        i = bisect.bisect_left(self._prefix_widths, relative_x)
+        self.cursor_pos = max(0, i - 1)
+
+    def _glyph_width(self, char: str) -> int:
+        """Get the pixel width of a single character (measured once per character)"""
+        width = self._glyph_widths.get(char)
+        if width is None:
+            width = self._glyph_widths[char] = self.font.size(char)[0]
+        return width
+
+    def _insert_width(self, pos: int, char: str):
+        """Update prefix widths for a character inserted at pos"""
+        width = self._glyph_width(char)
+        prefix_widths = self._prefix_widths
+        prefix_widths.insert(pos + 1, prefix_widths[pos])
+        for i in range(pos + 1, len(prefix_widths)):
+            prefix_widths[i] += width
+
+    def _remove_width(self, pos: int):
+        """Update prefix widths for the character removed at pos"""
+        prefix_widths = self._prefix_widths
+        width = prefix_widths[pos + 1] - prefix_widths[pos]
+        del prefix_widths[pos + 1]
+        for i in range(pos + 1, len(prefix_widths)):
+            prefix_widths[i] -= width
+
+    def _rebuild_widths(self):
+        """Recompute prefix widths for the whole text"""
+        self._prefix_widths = list(accumulate(map(self._glyph_width, self.text), initial=0))
 
     def _update_scroll(self):
         """Update scroll offset to keep cursor visible"""
-        if not self.text:
+        if not self._before and not self._after:
             self.scroll_offset = 0
             return
 
         # Calculate cursor pixel position
-        text_before_cursor = self.text[:self.cursor_pos]
-        cursor_x = self.font.size(text_before_cursor)[0]
+        cursor_x = self._prefix_widths[self.cursor_pos]
 
         # Available width for text (minus padding and prompt)
         available_width = self.rect.width - 20 - self.prompt_width
@@ -191,22 +275,17 @@ class ChatInput:
     def clear(self):
         """Clear input text"""
         self.text = ""
-        self.cursor_pos = 0
         self.scroll_offset = 0
 
     def set_text(self, text: str):
         """Set input text programmatically"""
-        self.text = text
-        self.cursor_pos = len(text)
+        self.text = text  # Leaves the cursor at the end
         self._update_scroll()
 
     def update(self):
         """Update animation (call every frame)"""
-        # Update cursor blink
-        self.cursor_timer += 1
-        if self.cursor_timer >= self.cursor_blink_rate:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
+        # Update cursor blink from the clock, so it only changes twice a second
+        self.cursor_visible = int(time.monotonic() / self.cursor_blink_interval) % 2 == 0
 
     def render(self, screen: pygame.Surface):
         """
@@ -220,7 +299,7 @@ class ChatInput:
         pygame.draw.rect(screen, self.BORDER_COLOR, self.rect, 1)
 
         # Draw prompt character
-        prompt_surface = self.font.render(self.prompt, True, self.TEXT_COLOR)
+        prompt_surface = self._prompt_surface
         prompt_x = self.rect.left + 10
         prompt_y = self.rect.centery - prompt_surface.get_height() // 2
         screen.blit(prompt_surface, (prompt_x, prompt_y))
@@ -230,9 +309,11 @@ class ChatInput:
         text_start_x = self.rect.left + 10 + self.prompt_width
 
         # Draw text or placeholder
-        if self.text:
-            # Render actual text
-            text_surface = self.font.render(self.text, True, self.TEXT_COLOR)
+        if self._before or self._after:
+            # Render actual text (cached until the text changes)
+            text_surface = self._text_surface
+            if text_surface is None:
+                text_surface = self._text_surface = self.font.render(self.text, True, self.TEXT_COLOR)
             # Apply scroll offset
             screen.blit(
                 text_surface,
@@ -251,7 +332,7 @@ class ChatInput:
         else:
             # Show placeholder if not active
             if not self.is_active:
-                placeholder_surface = self.font.render(self.placeholder, True, self.PLACEHOLDER_COLOR)
+                placeholder_surface = self._placeholder_surface
                 screen.blit(
                     placeholder_surface,
                     (text_start_x, self.rect.centery - placeholder_surface.get_height() // 2)
@@ -263,11 +344,10 @@ class ChatInput:
     def _draw_cursor(self, screen: pygame.Surface):
         """Draw terminal-style block cursor"""
         # Calculate cursor position
-        text_before_cursor = self.text[:self.cursor_pos]
-        cursor_x = self.font.size(text_before_cursor)[0] - self.scroll_offset
+        cursor_x = self._prefix_widths[self.cursor_pos] - self.scroll_offset
 
         # Get character at cursor position (or space if at end)
-        char_at_cursor = self.text[self.cursor_pos] if self.cursor_pos < len(self.text) else " "
+        char_at_cursor = self._after[-1] if self._after else " "
         char_surface = self.font.render(char_at_cursor, True, self.BG_COLOR)
         char_width = char_surface.get_width()
         char_height = char_surface.get_height()
@@ -286,7 +366,7 @@ class ChatInput:
         pygame.draw.rect(screen, self.CURSOR_COLOR, cursor_rect)
 
         # Draw the character in inverted color (black on green)
-        if self.cursor_pos < len(self.text):
+        if self._after:
             screen.blit(char_surface, (cursor_screen_x, cursor_screen_y))
 
 
@@ -5,9 +5,11 @@ Main chat UI component that combines all chat elements.
 """
 
 import pygame
-from typing import List, Dict, Optional, Callable
-from datetime import datetime
+from bisect import bisect_right
+from itertools import islice
+from typing import List, Dict, Optional, Callable, Sequence
 import threading
+import time
 
 from poker_ev.gui.chat.scroll_handler import ScrollHandler
 from poker_ev.gui.chat.message_renderer import MessageRenderer
@@ -69,6 +71,13 @@ class ChatPanel:
             self.header_height
         )
 
+        # Title never changes - render it once
+        self._title_surface = font_large.render("POKER ADVISOR", True, self.HEADER_TEXT)
+        self._title_pos = (
+            self.header_rect.centerx - self._title_surface.get_width() // 2,
+            self.header_rect.centery - self._title_surface.get_height() // 2
+        )
+
         # Input area
         self.input_height = 60
         self.input_rect = pygame.Rect(
@@ -100,12 +109,25 @@ class ChatPanel:
             on_submit=self._handle_message_submit
         )
 
+        # Event type -> handler; anything else is not ours
+        self._event_handlers = {
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_button_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.KEYDOWN: self.chat_input.handle_event,
+        }
+
         # Messages
         self.messages: List[Dict] = []
+        self._total_height = 0  # Running scroll content height of all messages
+        self._y_offsets = [0]   # Layout top of each message, plus the end of the last one
 
         # State
         self.is_waiting_response = False
         self.typing_animation_frame = 0
+        self._dirty = True  # Something visible changed since the last render
+        self._blink_rect: Optional[pygame.Rect] = None  # Area changed by cursor blinks alone
 
         # Streaming state
         self.streaming_message_content = ""
@@ -133,15 +155,17 @@ class ChatPanel:
         message = {
             'role': role,
             'content': content,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'metadata': metadata or {}
         }
 
         self.messages.append(message)
+        self._y_offsets.append(self._y_offsets[-1] + self.message_renderer.message_height(message))
 
         # Update scroll content height
-        total_height = self.message_renderer.calculate_messages_height(self.messages)
-        self.scroll_handler.set_content_height(total_height)
+        self._total_height += self.message_renderer.measure_message(message)
+        self.scroll_handler.set_content_height(self._total_height)
+        self._dirty = True
 
     def _add_system_message(self, content: str):
         """Add a system message"""
@@ -190,14 +214,16 @@ class ChatPanel:
         message = {
             'role': 'assistant',
             'content': '',
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'metadata': {'streaming': True}
         }
         self.messages.append(message)
+        self._y_offsets.append(self._y_offsets[-1] + self.message_renderer.message_height(message))
 
         # Update scroll
-        total_height = self.message_renderer.calculate_messages_height(self.messages)
-        self.scroll_handler.set_content_height(total_height)
+        self._total_height += self.message_renderer.measure_message(message)
+        self.scroll_handler.set_content_height(self._total_height)
+        self._dirty = True
 
     def append_to_streaming_message(self, chunk: str):
         """
@@ -210,15 +236,19 @@ class ChatPanel:
             return
 
         # Update the last message (streaming message)
+        message = self.messages[-1]
+        self._total_height -= self.message_renderer.measure_message(message)
         self.streaming_message_content += chunk
-        self.messages[-1]['content'] = self.streaming_message_content
+        message['content'] = self.streaming_message_content
 
         # Update scroll
-        total_height = self.message_renderer.calculate_messages_height(self.messages)
-        self.scroll_handler.set_content_height(total_height)
+        self._y_offsets[-1] = self._y_offsets[-2] + self.message_renderer.message_height(message)
+        self._total_height += self.message_renderer.measure_message(message)
+        self.scroll_handler.set_content_height(self._total_height)
 
         # Auto-scroll to bottom to show new content
         self.scroll_handler.scroll_to_bottom()
+        self._dirty = True
 
     def finalize_streaming_message(self):
         """Finalize the streaming message"""
@@ -239,57 +269,86 @@ class ChatPanel:
         Returns:
             True if event was handled (and should not be passed to game)
         """
-        # Handle scrolling
-        if event.type == pygame.MOUSEWHEEL:
-            mouse_pos = pygame.mouse.get_pos()
-            if self.messages_area.collidepoint(mouse_pos):
-                self.scroll_handler.handle_mouse_wheel(event)
-                return True
-
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = event.pos
-            # Only handle if click is within chat panel area
-            if self.rect.collidepoint(mouse_pos):
-                self.scroll_handler.handle_mouse_button_down(event)
-                # Also check chat input
-                return self.chat_input.handle_event(event) or True
+        handler = self._event_handlers.get(event.type)
+        if handler is None:
             return False
 
-        elif event.type == pygame.MOUSEBUTTONUP:
-            self.scroll_handler.handle_mouse_button_up(event)
-            # Let scrollbar always handle button up (for drag release)
-            # But don't consume the event unless we're dragging
-            if self.scroll_handler.is_dragging:
-                return True
+        # Scrolling, scrollbar hover/drag and typing all change what the panel shows
+        self._dirty = True
+        return handler(event)
 
-        elif event.type == pygame.MOUSEMOTION:
-            self.scroll_handler.handle_mouse_motion(event)
-            # Only consume motion if we're dragging scrollbar
-            if self.scroll_handler.is_dragging:
-                return True
-
-        # Handle input for keyboard events
-        if event.type == pygame.KEYDOWN:
-            return self.chat_input.handle_event(event)
+    def _on_mouse_wheel(self, event: pygame.event.Event) -> bool:
+        """Scroll messages when the wheel turns over them"""
+        mouse_pos = pygame.mouse.get_pos()
+        if self.messages_area.collidepoint(mouse_pos):
+            self.scroll_handler.handle_mouse_wheel(event)
+            return True
+        return False
 
+    def _on_mouse_button_down(self, event: pygame.event.Event) -> bool:
+        """Handle clicks inside the panel (scrollbar and input focus)"""
+        # Only handle if click is within chat panel area
+        if self.rect.collidepoint(event.pos):
+            self.scroll_handler.handle_mouse_button_down(event)
+            # Also check chat input
+            return self.chat_input.handle_event(event) or True
         return False
 
+    def _on_mouse_button_up(self, event: pygame.event.Event) -> bool:
+        """Release scrollbar drags"""
+        self.scroll_handler.handle_mouse_button_up(event)
+        # Let scrollbar always handle button up (for drag release)
+        # But don't consume the event unless we're dragging
+        return self.scroll_handler.is_dragging
+
+    def _on_mouse_motion(self, event: pygame.event.Event) -> bool:
+        """Track scrollbar hover and drags"""
+        self.scroll_handler.handle_mouse_motion(event)
+        # Only consume motion if we're dragging scrollbar
+        return self.scroll_handler.is_dragging
+
     def update(self):
         """Update animations (call every frame)"""
+        cursor_visible = self.chat_input.cursor_visible
         self.chat_input.update()
+        if self.chat_input.cursor_visible != cursor_visible:
+            self._mark_blink(self.input_rect)
 
-        # Update typing animation
+        # Update typing animation from the clock as a 60-per-second frame number, so it
+        # keeps its pace when the game loop slows; redraw only when its cursor blinks
         if self.is_waiting_response:
-            self.typing_animation_frame = (self.typing_animation_frame + 1) % 60
+            blink_on = self.typing_animation_frame % 30 < 15
+            self.typing_animation_frame = int(time.monotonic() * 60) % 60
+            if (self.typing_animation_frame % 30 < 15) != blink_on:
+                self._mark_blink(self.messages_area)
+
+    def _mark_blink(self, rect: pygame.Rect):
+        """Record an area that changed only because a cursor blinked (main thread only)"""
+        self._blink_rect = rect if self._blink_rect is None else self._blink_rect.union(rect)
+
+    def needs_redraw(self) -> bool:
+        """
+        Check whether anything visible changed since the last render
+
+        Callers that keep the previous frame on screen can skip render() when False.
+        """
+        return self._dirty or self._blink_rect is not None
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface) -> pygame.Rect:
         """
         Render the chat panel
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area that changed (for pygame.display.update) - the whole panel,
+            or just the blinking cursor's area when nothing else changed
         """
-        mouse_pos = pygame.mouse.get_pos()
+        # Cleared first so changes made by other threads while drawing trigger another frame
+        changed = self.rect if self._dirty or self._blink_rect is None else self._blink_rect
+        self._dirty = False
+        self._blink_rect = None
 
         # Draw panel background
         pygame.draw.rect(screen, self.PANEL_BG, self.rect)
@@ -318,12 +377,14 @@ class ChatPanel:
         # Draw messages
         self._render_messages(screen)
 
-        # Draw scrollbar
-        self.scroll_handler.render(screen, mouse_pos)
+        # Draw scrollbar (it reads the mouse position only if there is a handle to hover)
+        self.scroll_handler.render(screen)
 
         # Draw input
         self.chat_input.render(screen)
 
+        return changed
+
     def _render_header(self, screen: pygame.Surface):
         """Render title bar header"""
         # Header background
@@ -344,11 +405,7 @@ class ChatPanel:
                         (self.header_rect.right - 2, self.header_rect.bottom), 2)
 
         # Title (centered, single line)
-        title = "POKER ADVISOR"
-        title_surface = self.font_large.render(title, True, self.HEADER_TEXT)
-        title_x = self.header_rect.centerx - title_surface.get_width() // 2
-        title_y = self.header_rect.centery - title_surface.get_height() // 2
-        screen.blit(title_surface, (title_x, title_y))
+        screen.blit(self._title_surface, self._title_pos)
 
     def _render_messages(self, screen: pygame.Surface):
         """Render all messages with scrolling"""
@@ -356,25 +413,24 @@ class ChatPanel:
         clip_rect = screen.get_clip()
         screen.set_clip(self.messages_area)
 
-        # Calculate starting Y position
+        # Skip straight to the first message whose bottom is below the scroll offset
         scroll_offset = self.scroll_handler.get_scroll_offset()
-        y = self.messages_area.top - scroll_offset
-
-        # Render each message
-        for message in self.messages:
-            # Only render if visible
-            if y > self.messages_area.bottom:
+        start = bisect_right(self._y_offsets, scroll_offset) - 1
+        y = self.messages_area.top - scroll_offset + self._y_offsets[start]
+
+        # Queue each visible message's cached surface, then draw them in one call
+        left = self.messages_area.left
+        bottom = self.messages_area.bottom
+        blits = []
+        for message in islice(self.messages, start, None):
+            # Stop at the first message starting at or below the viewport bottom
+            if y >= bottom:
                 break
 
-            height = self.message_renderer.render_message(
-                screen,
-                message,
-                self.messages_area.left,
-                y,
-                show_timestamp=True
-            )
-
-            y += height
+            surface = self.message_renderer.prerender_message(message)
+            blits.append((surface, (left, y)))
+            y += surface.get_height()
+        screen.blits(blits, doreturn=False)
 
         # Render typing indicator if waiting
         if self.is_waiting_response:
@@ -389,19 +445,39 @@ class ChatPanel:
         # Restore clipping
         screen.set_clip(clip_rect)
 
+    def refresh_layout(self):
+        """Re-measure every message (call after changing the renderer's fonts or width)"""
+        self.message_renderer.clear_cache()
+        y_offsets = [0]
+        total_height = 0
+        for message in self.messages:
+            y_offsets.append(y_offsets[-1] + self.message_renderer.message_height(message))
+            total_height += self.message_renderer.measure_message(message)
+        self._y_offsets = y_offsets
+        self._total_height = total_height
+        self.scroll_handler.set_content_height(total_height)
+        self._dirty = True
+
     def clear_messages(self):
         """Clear all messages"""
         self.messages.clear()
+        self._total_height = 0
+        self._y_offsets = [0]
         self.scroll_handler.set_content_height(0)
         self._add_system_message("Chat cleared. How can I help?")
 
     def set_typing(self, is_typing: bool):
         """Set typing indicator state"""
         self.is_waiting_response = is_typing
+        self._dirty = True
+
+    def get_messages(self) -> Sequence[Dict]:
+        """Get all messages (the live list - read only, do not mutate)"""
+        return self.messages
 
-    def get_messages(self) -> List[Dict]:
-        """Get all messages"""
-        return self.messages.copy()
+    def get_messages_snapshot(self) -> List[Dict]:
+        """Get a copy of the message list, safe to keep while the chat changes"""
+        return list(self.messages)
 
 
 # Example usage
@@ -426,7 +502,6 @@ if __name__ == "__main__":
 
     def handle_message(text: str):
         """Simulate AI response"""
-        import time
         time.sleep(1)  # Simulate processing
         chat_panel.add_ai_response(
             f"You asked: '{text}'. This is a test response from the AI advisor."
@@ -450,6 +525,17 @@ if __name__ == "__main__":
         'Pocket jacks are a strong hand, but position matters. What position are you in and what\'s the action in front of you?'
     )
 
+    # Only queue the events this loop and the panel act on
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([
+        pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL,
+        pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION
+    ])
+
+    # Draw the background once; each frame only the chat panel is redrawn and updated
+    screen.fill((15, 15, 15))
+    pygame.display.flip()
+
     running = True
     while running:
         for event in pygame.event.get():
@@ -464,13 +550,9 @@ if __name__ == "__main__":
         # Update
         chat_panel.update()
 
-        # Clear screen
-        screen.fill((15, 15, 15))
-
-        # Render chat panel
-        chat_panel.render(screen)
-
-        pygame.display.flip()
+        # Render chat panel and push just its area to the display, only when it changed
+        if chat_panel.needs_redraw():
+            pygame.display.update(chat_panel.render(screen))
         clock.tick(60)
 
     pygame.quit()
@@ -7,8 +7,9 @@ Supports markdown formatting (bold, italic, headers, bullets).
 
 import pygame
 import re
-from typing import List, Dict, Tuple
-from datetime import datetime
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 
 
 class MessageRenderer:
@@ -24,8 +25,16 @@ class MessageRenderer:
     BORDER_COLOR = (0, 255, 0)       # Neon green borders
     TIMESTAMP_COLOR = (0, 150, 0)    # Dimmed green for timestamps
 
+    # Role -> (text color, right-aligned); user messages sit on the right
+    _ROLE_STYLE = {
+        'user': (TEXT_USER, True),
+        'assistant': (TEXT_AI, False),
+        'system': (TEXT_SYSTEM, False),
+    }
+
     # Card suit symbols that need Unicode font
     SUIT_SYMBOLS = ['♠', '♥', '♦', '♣']
+    _SUIT_RUN_RE = re.compile('([' + ''.join(SUIT_SYMBOLS) + ']+)')
 
     # Text styling types
     STYLE_NORMAL = 'normal'
@@ -34,10 +43,28 @@ class MessageRenderer:
     STYLE_BOLD_ITALIC = 'bold_italic'
     STYLE_HEADER = 'header'
 
+    # Markdown patterns: headers (# or ##), bullets (- or *), and **bold** / *italic*
+    # (bold first) inline
+    _HEADER_RE = re.compile(r'^(#{1,2})\s+(.+)$')
+    _BULLET_RE = re.compile(r'^[-\*]\s+(.+)$')
+    _BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+    _ITALIC_RE = re.compile(r'\*(.+?)\*')
+    _INLINE_RE = re.compile(r'(\*\*(.+?)\*\*)|(\*(.+?)\*)')
+
+    # Maximum entries kept in each render/measure cache (least recently used are evicted)
+    CACHE_SIZE = 2048
+    # Whole rendered lines are much larger than word surfaces, so fewer are kept
+    LINE_CACHE_SIZE = 256
+    # Whole message surfaces are larger still; only those near the view are redrawn
+    MESSAGE_CACHE_SIZE = 64
+
     def __init__(self, font_small, font_medium, max_width: int = 350):
         """
         Initialize message renderer
 
+        Cached surfaces are converted to the display's pixel format when they are
+        created (once a display mode is set), so per-frame blits need no conversion.
+
         Args:
             font_small: Small pygame font (for timestamps)
             font_medium: Medium pygame font (for message content)
@@ -71,6 +98,128 @@ class MessageRenderer:
         except:
             self.font_italic = None
 
+        # LRU caches so unchanged text is not re-rasterized or re-measured every frame:
+        # (font id, text, color) -> Surface, (font id, text) -> width,
+        # text -> suit/text segments, (text, style) -> width
+        self._surface_cache: OrderedDict = OrderedDict()
+        self._width_cache: OrderedDict = OrderedDict()
+        self._segment_cache: OrderedDict = OrderedDict()
+        self._styled_width_cache: OrderedDict = OrderedDict()
+        # (line segments, color) -> (Surface, width); while streaming only the last line changes
+        self._line_surface_cache: OrderedDict = OrderedDict()
+        # id(message) -> (message, layout key, wrapped lines / Surface). Kept here rather
+        # than on the message dicts, which ChatPanel hands out; holding the message keeps
+        # its id from being reused while the entry exists
+        self._message_lines_cache: OrderedDict = OrderedDict()
+        self._message_surface_cache: OrderedDict = OrderedDict()
+        # (style, base color) -> styled text color
+        self._style_colors: Dict[Tuple[str, Tuple[int, int, int]], Tuple[int, int, int]] = {}
+        # Cursor visible -> typing indicator surface
+        self._typing_surfaces: Dict[bool, pygame.Surface] = {}
+
+        # Suit symbols are taller than the bold/italic fonts and are centred on them,
+        # so they can reach a little outside a line; rendered lines leave room for that
+        symbol_height = self.font_symbols.get_height()
+        self._line_margin = max(0, max(
+            (symbol_height - font.get_height() + 1) // 2
+            for font in (self.font_medium, self.font_bold, self.font_italic) if font
+        ))
+
+        # Bumped by clear_cache(); part of the key for per-message layouts, so an entry
+        # stored by another thread during the clear is not reused
+        self._layout_version = 0
+
+    def clear_cache(self):
+        """Drop cached surfaces, widths and wrapped lines (call after changing fonts)"""
+        self._layout_version += 1
+        self._surface_cache.clear()
+        self._width_cache.clear()
+        self._segment_cache.clear()
+        self._styled_width_cache.clear()
+        self._line_surface_cache.clear()
+        self._message_lines_cache.clear()
+        self._message_surface_cache.clear()
+        self._typing_surfaces.clear()
+
+    def _cache_get(self, cache: OrderedDict, key):
+        """Look up an LRU cache entry, marking it most recently used (None if missing)"""
+        value = cache.get(key)
+        if value is not None:
+            # Streaming chunks are measured on the advisor's worker thread while the
+            # render thread draws, so the other thread may evict the entry (or clear
+            # the cache) between these two calls
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key, value, limit: Optional[int] = None):
+        """Store a value in an LRU cache, evicting the oldest entry when full"""
+        cache[key] = value
+        if len(cache) > (self.CACHE_SIZE if limit is None else limit):
+            # Another thread may have emptied it meanwhile (see _cache_get)
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+
+    def _new_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Create an opaque surface, in the display's pixel format once a display is set
+
+        Creating it in that format directly avoids the copy convert() would make.
+
+        Args:
+            size: (width, height) of the surface
+
+        Returns:
+            New surface
+        """
+        display = pygame.display.get_surface()
+        if display is not None:
+            return pygame.Surface(size, 0, display)
+        return pygame.Surface(size)
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from an earlier identical call
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface (shared - do not draw onto it)
+        """
+        key = (id(font), text, color)
+        surface = self._cache_get(self._surface_cache, key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._cache_put(self._surface_cache, key, surface)
+        return surface
+
+    def _text_width(self, font: pygame.font.Font, text: str) -> int:
+        """
+        Measure text width, reusing earlier measurements
+
+        Args:
+            font: Font to measure with
+            text: Text to measure
+
+        Returns:
+            Width in pixels
+        """
+        key = (id(font), text)
+        width = self._cache_get(self._width_cache, key)
+        if width is None:
+            width = font.size(text)[0]
+            self._cache_put(self._width_cache, key, width)
+        return width
+
     def parse_markdown(self, text: str) -> List[Tuple[str, str]]:
         """
         Parse markdown text into styled segments
@@ -99,20 +248,20 @@ class MessageRenderer:
                 continue
 
             # Check for headers (lines starting with # or ##)
-            header_match = re.match(r'^(#{1,2})\s+(.+)$', line)
+            header_match = self._HEADER_RE.match(line)
             if header_match:
                 header_level = len(header_match.group(1))
                 header_text = header_match.group(2)
                 # Remove markdown from header text
-                header_text = re.sub(r'\*\*(.+?)\*\*', r'\1', header_text)
-                header_text = re.sub(r'\*(.+?)\*', r'\1', header_text)
+                header_text = self._BOLD_RE.sub(r'\1', header_text)
+                header_text = self._ITALIC_RE.sub(r'\1', header_text)
                 segments.append((header_text, self.STYLE_HEADER))
                 if line_idx < len(lines) - 1:
                     segments.append(('\n', self.STYLE_NORMAL))
                 continue
 
             # Check for bullet points (lines starting with - or *)
-            bullet_match = re.match(r'^[-\*]\s+(.+)$', line)
+            bullet_match = self._BULLET_RE.match(line)
             if bullet_match:
                 bullet_text = bullet_match.group(1)
                 segments.append(('• ', self.STYLE_BOLD))  # Use bullet point
@@ -139,12 +288,9 @@ class MessageRenderer:
             text: Text to parse
             segments: List to append parsed segments to
         """
-        # Pattern to match **bold** or *italic*
         # Match **text** first (bold), then *text* (italic)
-        pattern = r'(\*\*(.+?)\*\*)|(\*(.+?)\*)'
-
         last_end = 0
-        for match in re.finditer(pattern, text):
+        for match in self._INLINE_RE.finditer(text):
             # Add any text before this match
             if match.start() > last_end:
                 normal_text = text[last_end:match.start()]
@@ -167,48 +313,6 @@ class MessageRenderer:
             if remaining:
                 segments.append((remaining, self.STYLE_NORMAL))
 
-    def wrap_text(self, text: str, max_width: int) -> List[str]:
-        """
-        Wrap text to fit within max width (handles mixed fonts and newlines)
-
-        Args:
-            text: Text to wrap
-            max_width: Maximum width in pixels
-
-        Returns:
-            List of wrapped text lines
-        """
-        # First, split by explicit newlines to preserve formatting
-        paragraphs = text.split('\n')
-        lines = []
-
-        for paragraph in paragraphs:
-            # Handle empty lines (from multiple newlines like \n\n)
-            if not paragraph.strip():
-                lines.append('')
-                continue
-
-            # Wrap each paragraph
-            words = paragraph.split(' ')
-            current_line = ""
-
-            for word in words:
-                test_line = f"{current_line} {word}".strip()
-                # Use mixed-font width calculation
-                test_width = self._get_mixed_font_width(test_line)
-
-                if test_width <= max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-
-            if current_line:
-                lines.append(current_line)
-
-        return lines if lines else [text]
-
     def _get_font_for_style(self, style: str) -> pygame.font.Font:
         """
         Get the appropriate font for a given style
@@ -239,18 +343,26 @@ class MessageRenderer:
         Returns:
             Color tuple
         """
+        # Only a few (style, color) pairs occur, so each is computed once
+        key = (style, base_color)
+        color = self._style_colors.get(key)
+        if color is not None:
+            return color
+
         if style == self.STYLE_BOLD or style == self.STYLE_HEADER:
             # Make bold text brighter
-            return tuple(min(255, int(c * 1.2)) for c in base_color)
+            color = tuple(min(255, int(c * 1.2)) for c in base_color)
         elif style == self.STYLE_ITALIC:
             # Slightly dimmer for italic
-            return tuple(max(0, int(c * 0.9)) for c in base_color)
+            color = tuple(max(0, int(c * 0.9)) for c in base_color)
         else:
-            return base_color
+            color = base_color
+        self._style_colors[key] = color
+        return color
 
-    def _render_styled_segment(
+    def _queue_styled_segment(
         self,
-        screen: pygame.Surface,
+        blits: List[Tuple[pygame.Surface, Tuple[int, int]]],
         text: str,
         style: str,
         x: int,
@@ -259,10 +371,10 @@ class MessageRenderer:
         handle_suits: bool = True
     ) -> int:
         """
-        Render a single styled text segment
+        Queue the surfaces for a styled text segment, for one Surface.blits call
 
         Args:
-            screen: Surface to draw on
+            blits: List of (surface, position) to append to
             text: Text to render
             style: Style type (STYLE_NORMAL, STYLE_BOLD, etc.)
             x: X position
@@ -271,7 +383,7 @@ class MessageRenderer:
             handle_suits: Whether to handle card suit symbols specially
 
         Returns:
-            Width of rendered text
+            Width of queued text
         """
         # Get font and color for this style
         font = self._get_font_for_style(style)
@@ -289,7 +401,7 @@ class MessageRenderer:
                 segment_color = color if is_symbol else styled_color
 
                 # Render segment
-                surface = segment_font.render(segment, True, segment_color)
+                surface = self._render_text(segment_font, segment, segment_color)
 
                 # Align vertically
                 segment_y = y
@@ -298,7 +410,7 @@ class MessageRenderer:
                     symbol_height = surface.get_height()
                     segment_y = y + (text_height - symbol_height) // 2
 
-                screen.blit(surface, (current_x, segment_y))
+                blits.append((surface, (current_x, segment_y)))
 
                 # Move x position
                 segment_width = surface.get_width()
@@ -308,8 +420,8 @@ class MessageRenderer:
             return total_width
         else:
             # Simple rendering without suit handling
-            surface = font.render(text, True, styled_color)
-            screen.blit(surface, (x, y))
+            surface = self._render_text(font, text, styled_color)
+            blits.append((surface, (x, y)))
             return surface.get_width()
 
     def _get_styled_segment_width(self, text: str, style: str) -> int:
@@ -323,6 +435,12 @@ class MessageRenderer:
         Returns:
             Width in pixels
         """
+        # Wrapping measures every word; one lookup here replaces the split and per-font lookups
+        key = (text, style)
+        total_width = self._cache_get(self._styled_width_cache, key)
+        if total_width is not None:
+            return total_width
+
         font = self._get_font_for_style(style)
 
         # Handle suit symbols
@@ -331,191 +449,191 @@ class MessageRenderer:
 
         for segment, is_symbol in segments:
             segment_font = self.font_symbols if is_symbol else font
-            width = segment_font.size(segment)[0]
-            total_width += width
+            total_width += self._text_width(segment_font, segment)
 
+        self._cache_put(self._styled_width_cache, key, total_width)
         return total_width
 
-    def _split_text_segments(self, text: str) -> List[Tuple[str, bool]]:
+    def _split_text_segments(self, text: str) -> Tuple[Tuple[str, bool], ...]:
         """
         Split text into segments of regular text and suit symbols
 
+        Each word is both measured and drawn, so results are cached per text.
+
         Args:
             text: Text to split
 
         Returns:
-            List of (segment, is_symbol) tuples
+            Tuple of (segment, is_symbol) tuples (shared - do not modify)
         """
-        segments = []
-        current_segment = ""
-        is_current_symbol = False
-
-        for char in text:
-            char_is_symbol = char in self.SUIT_SYMBOLS
-
-            if not current_segment:
-                # Start new segment
-                current_segment = char
-                is_current_symbol = char_is_symbol
-            elif char_is_symbol == is_current_symbol:
-                # Continue current segment
-                current_segment += char
-            else:
-                # Different type - save current and start new
-                segments.append((current_segment, is_current_symbol))
-                current_segment = char
-                is_current_symbol = char_is_symbol
-
-        # Add final segment
-        if current_segment:
-            segments.append((current_segment, is_current_symbol))
+        cached = self._cache_get(self._segment_cache, text)
+        if cached is not None:
+            return cached
 
+        # The capturing split alternates text and symbol runs, starting with (possibly empty) text
+        parts = self._SUIT_RUN_RE.split(text)
+        if len(parts) == 1:
+            # No suit symbols (most text) - skip building segments from the parts
+            segments = ((text, False),) if text else ()
+        else:
+            segments = tuple((part, i % 2 == 1) for i, part in enumerate(parts) if part)
+        self._cache_put(self._segment_cache, text, segments)
         return segments
 
-    def _render_mixed_font_line(
+    def render_message(
         self,
         screen: pygame.Surface,
-        text: str,
+        message: Dict,
         x: int,
         y: int,
-        color: Tuple[int, int, int]
+        show_timestamp: bool = False
     ) -> int:
         """
-        Render a line with mixed fonts (retro for text, system for symbols)
+        Render a single message in terminal style with markdown support
 
         Args:
-            screen: Surface to draw on
-            text: Text to render
+            screen: Pygame surface to draw on
+            message: Message dict with 'role', 'content', 'timestamp'
             x: X position
             y: Y position
-            color: Text color
+            show_timestamp: Whether to show timestamp
 
         Returns:
-            Width of rendered text
+            Height of rendered message (for positioning next message)
         """
-        segments = self._split_text_segments(text)
-        current_x = x
-        total_width = 0
-
-        for segment, is_symbol in segments:
-            # Choose font based on segment type
-            font = self.font_symbols if is_symbol else self.font_medium
-
-            # Render segment
-            surface = font.render(segment, True, color)
-
-            # Align vertically (symbols might be different height)
-            segment_y = y
-            if is_symbol:
-                # Center symbol vertically with text
-                text_height = self.font_medium.get_height()
-                symbol_height = surface.get_height()
-                segment_y = y + (text_height - symbol_height) // 2
-
-            screen.blit(surface, (current_x, segment_y))
+        surface = self.prerender_message(message)
+        screen.blit(surface, (x, y))
+        return surface.get_height()
 
-            # Move x position for next segment
-            segment_width = surface.get_width()
-            current_x += segment_width
-            total_width += segment_width
-
-        return total_width
-
-    def _get_mixed_font_width(self, text: str) -> int:
+    def _wrap_message(self, message: Dict) -> List[List[Tuple[str, str]]]:
         """
-        Get the width of text with mixed fonts
+        Parse and wrap a message's content, cached per message until its content changes
 
         Args:
-            text: Text to measure
+            message: Message dict with 'content'
 
         Returns:
-            Width in pixels
+            List of lines, each containing styled segments
         """
-        segments = self._split_text_segments(text)
-        total_width = 0
+        key = (message.get('content', ''), self.max_width, self._layout_version)
+        cached = self._cache_get(self._message_lines_cache, id(message))
+        if cached is not None and cached[1] == key:
+            return cached[2]
 
-        for segment, is_symbol in segments:
-            font = self.font_symbols if is_symbol else self.font_medium
-            width = font.size(segment)[0]
-            total_width += width
+        # Parse markdown into styled segments and wrap them into lines
+        styled_segments = self.parse_markdown(key[0])
+        content_width = self.max_width - 2 * self.padding
+        wrapped_lines = self._wrap_styled_segments(styled_segments, content_width)
 
-        return total_width
+        # Stored as one tuple so a reader on another thread never sees lines from other content
+        self._cache_put(self._message_lines_cache, id(message), (message, key, wrapped_lines))
+        return wrapped_lines
 
-    def render_message(
-        self,
-        screen: pygame.Surface,
-        message: Dict,
-        x: int,
-        y: int,
-        show_timestamp: bool = False
-    ) -> int:
+    def prerender_message(self, message: Dict) -> pygame.Surface:
         """
-        Render a single message in terminal style with markdown support
+        Rasterize a whole message into one surface, cached per message
+
+        The surface is rebuilt only when the content changes (e.g. while streaming),
+        so drawing a message each frame is a single blit.
 
         Args:
-            screen: Pygame surface to draw on
-            message: Message dict with 'role', 'content', 'timestamp'
-            x: X position
-            y: Y position
-            show_timestamp: Whether to show timestamp
+            message: Message dict with 'role', 'content'
 
         Returns:
-            Height of rendered message (for positioning next message)
+            Surface holding the rendered message; its height is the message height
         """
-        role = message.get('role', 'user')
-        content = message.get('content', '')
-        timestamp = message.get('timestamp', '')
-
-        # Determine text color based on role
-        if role == 'user':
-            text_color = self.TEXT_USER
-            align_right = True
-        elif role == 'assistant':
-            text_color = self.TEXT_AI
-            align_right = False
-        else:  # system
-            text_color = self.TEXT_SYSTEM
-            align_right = False
-
-        # Parse markdown into styled segments
-        styled_segments = self.parse_markdown(content)
-
-        # Wrap styled segments into lines
-        content_width = self.max_width - 2 * self.padding
-        wrapped_lines = self._wrap_styled_segments(styled_segments, content_width)
+        key = (message.get('content', ''), self.max_width, self._layout_version)
+        cached = self._cache_get(self._message_surface_cache, id(message))
+        if cached is not None and cached[1] == key:
+            return cached[2]
 
-        # Calculate message dimensions
-        line_height = self.font_medium.get_height()
-        total_height = 0
+        # Determine text color and alignment based on role (anything unknown renders as system)
+        text_color, align_right = self._ROLE_STYLE.get(
+            message.get('role', 'user'), self._ROLE_STYLE['system']
+        )
 
-        # Render each line with styled segments
-        text_y = y + self.padding
-        for line_segments in wrapped_lines:
-            # Calculate line width for alignment
-            line_width = sum(self._get_styled_segment_width(text, style) for text, style in line_segments)
+        wrapped_lines = self._wrap_message(message)
+        total_height = self.message_height(message)
+        rendered_lines = [self._render_line(line_segments, text_color) for line_segments in wrapped_lines]
+        line_widths = [line_width for _, line_width in rendered_lines]
 
+        line_height = self.font_medium.get_height()
+
+        # Over-long words may run past max_width on the left-aligned side; keep them visible
+        surface_width = self.max_width
+        if not align_right and line_widths:
+            surface_width = max(surface_width, self.padding + max(line_widths))
+
+        # Text is drawn onto the panel background, which is then keyed out so the panel
+        # border underneath stays visible (RLE colorkey blits faster than per-pixel alpha)
+        surface = self._new_surface((surface_width, total_height))
+        surface.fill(self.BG_DARK)
+
+        # Queue every line, then draw them in one call
+        padding = self.padding
+        right_edge = self.max_width - padding
+        advance = line_height + self.line_spacing
+        blits = []
+        text_y = padding - self._line_margin
+        for line_surface, line_width in rendered_lines:
             if align_right:
                 # User messages on right
-                text_x = x + self.max_width - line_width - self.padding
+                text_x = right_edge - line_width
             else:
                 # AI/System messages on left
-                text_x = x + self.padding
+                text_x = padding
 
-            # Render each segment in the line
-            current_x = text_x
-            for segment_text, segment_style in line_segments:
-                if segment_text == '\n':
-                    continue
-                width = self._render_styled_segment(
-                    screen, segment_text, segment_style,
-                    current_x, text_y, text_color
-                )
-                current_x += width
+            blits.append((line_surface, (text_x, text_y)))
+            text_y += advance
 
-            text_y += line_height + self.line_spacing
-            total_height += line_height + self.line_spacing
+        surface.blits(blits, doreturn=False)
+        surface.set_colorkey(self.BG_DARK, pygame.RLEACCEL)
+        self._cache_put(self._message_surface_cache, id(message), (message, key, surface),
+                        self.MESSAGE_CACHE_SIZE)
+        return surface
 
-        return total_height + self.padding * 2  # Add spacing after message
+    def _render_line(
+        self,
+        line_segments: List[Tuple[str, str]],
+        color: Tuple[int, int, int]
+    ) -> Tuple[pygame.Surface, int]:
+        """
+        Render one wrapped line, reusing the surface of an identical earlier line
+
+        A streaming message is re-rendered on every chunk, but only its last line
+        changes; the lines above it come straight from this cache.
+
+        Args:
+            line_segments: Styled (text, style) segments of the line
+            color: Base text color
+
+        Returns:
+            Tuple of (line surface, line width); the surface has its background keyed
+            out and extends _line_margin above and below the line
+        """
+        key = (tuple(line_segments), color)
+        cached = self._cache_get(self._line_surface_cache, key)
+        if cached is not None:
+            return cached
+
+        line_width = sum(self._get_styled_segment_width(text, style) for text, style in line_segments)
+        margin = self._line_margin
+        surface = self._new_surface((max(line_width, 1), self.font_medium.get_height() + 2 * margin))
+        surface.fill(self.BG_DARK)
+
+        blits = []
+        current_x = 0
+        for segment_text, segment_style in line_segments:
+            if segment_text == '\n':
+                continue
+            current_x += self._queue_styled_segment(
+                blits, segment_text, segment_style, current_x, margin, color
+            )
+        surface.blits(blits, doreturn=False)
+        surface.set_colorkey(self.BG_DARK, pygame.RLEACCEL)
+
+        self._cache_put(self._line_surface_cache, key, (surface, line_width), self.LINE_CACHE_SIZE)
+        return surface, line_width
 
     def _wrap_styled_segments(self, segments: List[Tuple[str, str]], max_width: int) -> List[List[Tuple[str, str]]]:
         """
@@ -569,113 +687,36 @@ class MessageRenderer:
 
         return lines if lines else [[('', self.STYLE_NORMAL)]]
 
-    def _draw_retro_border(self, screen: pygame.Surface, rect: pygame.Rect, role: str):
+    def message_height(self, message: Dict) -> int:
         """
-        Draw System 6-style borders based on role
+        Calculate how far a rendered message advances the layout (see render_message)
 
         Args:
-            screen: Surface to draw on
-            rect: Rectangle to border
-            role: Message role (user, assistant, system)
-        """
-        if role == 'user':
-            # Double border (like active window)
-            pygame.draw.rect(screen, self.ACCENT_PRIMARY, rect, 2)
-            inner_rect = rect.inflate(-6, -6)
-            pygame.draw.rect(screen, self.ACCENT_DIM, inner_rect, 1)
-        elif role == 'assistant':
-            # Single border
-            pygame.draw.rect(screen, self.ACCENT_PRIMARY, rect, 1)
-        else:  # system
-            # Dashed border pattern
-            self._draw_dashed_border(screen, rect)
-
-    def _draw_dashed_border(self, screen: pygame.Surface, rect: pygame.Rect):
-        """
-        Draw retro dashed border for system messages
-
-        Args:
-            screen: Surface to draw on
-            rect: Rectangle to border
-        """
-        dash_length = 8
-        gap_length = 4
-
-        # Draw top edge
-        x = rect.left
-        while x < rect.right:
-            end_x = min(x + dash_length, rect.right)
-            pygame.draw.line(screen, self.ACCENT_PRIMARY, (x, rect.top), (end_x, rect.top), 1)
-            x += dash_length + gap_length
-
-        # Draw bottom edge
-        x = rect.left
-        while x < rect.right:
-            end_x = min(x + dash_length, rect.right)
-            pygame.draw.line(screen, self.ACCENT_PRIMARY, (x, rect.bottom - 1), (end_x, rect.bottom - 1), 1)
-            x += dash_length + gap_length
-
-        # Draw left edge
-        y = rect.top
-        while y < rect.bottom:
-            end_y = min(y + dash_length, rect.bottom)
-            pygame.draw.line(screen, self.ACCENT_PRIMARY, (rect.left, y), (rect.left, end_y), 1)
-            y += dash_length + gap_length
-
-        # Draw right edge
-        y = rect.top
-        while y < rect.bottom:
-            end_y = min(y + dash_length, rect.bottom)
-            pygame.draw.line(screen, self.ACCENT_PRIMARY, (rect.right - 1, y), (rect.right - 1, end_y), 1)
-            y += dash_length + gap_length
-
-    def _format_timestamp(self, timestamp_str: str) -> str:
-        """
-        Format timestamp for display
-
-        Args:
-            timestamp_str: ISO format timestamp string
+            message: Message dict
 
         Returns:
-            Formatted time string (e.g., "14:32")
+            Height in pixels
         """
-        try:
-            dt = datetime.fromisoformat(timestamp_str)
-            return dt.strftime("%H:%M")
-        except Exception:
-            return ""
+        num_lines = len(self._wrap_message(message))
+        return num_lines * (self.font_medium.get_height() + self.line_spacing) + self.padding * 2
 
-    def calculate_messages_height(self, messages: List[Dict]) -> int:
+    def measure_message(self, message: Dict) -> int:
         """
-        Calculate total height needed for all messages (with markdown support)
+        Calculate the height a single message adds to the scrollable content
 
         Args:
-            messages: List of message dicts
+            message: Message dict
 
         Returns:
-            Total height in pixels
+            Height in pixels
         """
-        total_height = 0
-
-        for message in messages:
-            content = message.get('content', '')
-            content_width = self.max_width - 2 * self.padding
-
-            # Parse markdown and wrap styled segments
-            styled_segments = self.parse_markdown(content)
-            wrapped_lines = self._wrap_styled_segments(styled_segments, content_width)
-
-            line_height = self.font_medium.get_height()
-            message_height = (
-                2 * self.padding +
-                len(wrapped_lines) * line_height +
-                (len(wrapped_lines) - 1) * self.line_spacing +
-                10  # Spacing after message
-            )
-
-            total_height += message_height
-
-        return total_height
+        num_lines = len(self._wrap_message(message))
+        return (
+            2 * self.padding +
+            num_lines * self.font_medium.get_height() +
+            (num_lines - 1) * self.line_spacing +
+            10  # Spacing after message
+        )
 
     def render_typing_indicator(
         self,
@@ -696,21 +737,44 @@ class MessageRenderer:
         Returns:
             Height of indicator
         """
+        # Blinking cursor (blink every 30 frames); each phase is drawn once and reused
+        cursor_visible = animation_frame % 30 < 15
+        surface = self._typing_surfaces.get(cursor_visible)
+        if surface is None:
+            surface = self._build_typing_indicator(cursor_visible)
+            self._typing_surfaces[cursor_visible] = surface
+        screen.blit(surface, (x, y))
+
+        return self.font_medium.get_height() + self.padding * 2
+
+    def _build_typing_indicator(self, cursor_visible: bool) -> pygame.Surface:
+        """
+        Draw the typing indicator into a new transparent surface
+
+        Args:
+            cursor_visible: Whether to draw the cursor
+
+        Returns:
+            Indicator surface, positioned like the indicator's (x, y)
+        """
         # Terminal-style: just text with blinking cursor
         typing_text = "..."
-        text_surface = self.font_medium.render(typing_text, True, self.TEXT_AI)
-        screen.blit(text_surface, (x + self.padding, y + self.padding))
-
-        # Blinking cursor (blink every 30 frames)
-        if animation_frame % 30 < 15:
-            cursor_x = x + self.padding + text_surface.get_width() + 2
-            cursor_y = y + self.padding
-            cursor_height = self.font_medium.get_height()
-            pygame.draw.line(screen, self.BORDER_COLOR,
+        text_surface = self._render_text(self.font_medium, typing_text, self.TEXT_AI)
+        cursor_x = self.padding + text_surface.get_width() + 2
+        cursor_height = self.font_medium.get_height()
+
+        # Room for the 2px cursor line, which includes its end point
+        surface = pygame.Surface((cursor_x + 2, self.padding + cursor_height + 1), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.blit(text_surface, (self.padding, self.padding))
+
+        if cursor_visible:
+            cursor_y = self.padding
+            pygame.draw.line(surface, self.BORDER_COLOR,
                            (cursor_x, cursor_y),
                            (cursor_x, cursor_y + cursor_height), 2)
-
-        return self.font_medium.get_height() + self.padding * 2
+        return surface
 
 
 # Example usage
@@ -736,40 +800,48 @@ if __name__ == "__main__":
         {
             'role': 'system',
             'content': 'Poker Advisor Ready! Ask me anything about your hand.',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         },
         {
             'role': 'user',
             'content': 'Should I call here with pocket jacks? The pot is $150 and I need to call $30.',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         },
         {
             'role': 'assistant',
             'content': 'With pocket jacks, calling for $30 into a $150 pot is a good play. You\'re getting 5:1 pot odds and JJ is a strong hand. However, be cautious of overcards on the flop.',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         }
     ]
 
+    # Messages are static: draw them once, then refresh only the typing indicator's area
+    # when its cursor blinks
+    screen.fill((20, 20, 20))
+    y = 20
+    blits = []
+    for msg in messages:
+        surface = renderer.prerender_message(msg)
+        blits.append((surface, (10, y)))
+        y += surface.get_height()
+    screen.blits(blits, doreturn=False)
+    indicator_rect = pygame.Rect(10, y, renderer.max_width, font_medium.get_height() + renderer.padding * 2)
+    pygame.display.flip()
+
     frame = 0
+    blink_on = None
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
-        # Clear screen
-        screen.fill((20, 20, 20))
-
-        # Render messages
-        y = 20
-        for msg in messages:
-            height = renderer.render_message(screen, msg, 10, y)
-            y += height
-
         # Render typing indicator
-        renderer.render_typing_indicator(screen, 10, y, frame)
+        if (frame % 30 < 15) != blink_on:
+            blink_on = frame % 30 < 15
+            screen.fill((20, 20, 20), indicator_rect)
+            renderer.render_typing_indicator(screen, 10, y, frame)
+            pygame.display.update(indicator_rect)
 
-        pygame.display.flip()
         clock.tick(60)
         frame = (frame + 1) % 60
 
@@ -189,13 +189,13 @@ class ScrollHandler:
         """Check if scrolled to bottom"""
         return self.scroll_offset >= self.max_scroll - 5  # 5px tolerance
 
-    def render(self, screen: pygame.Surface, mouse_pos: Tuple[int, int]):
+    def render(self, screen: pygame.Surface, mouse_pos: Optional[Tuple[int, int]] = None):
         """
         Render System 6-style scrollbar
 
         Args:
             screen: Pygame surface to draw on
-            mouse_pos: Current mouse position
+            mouse_pos: Current mouse position (queried only if a handle is drawn and none is given)
         """
         # Only render if content is scrollable
         if self.content_height <= self.scroll_area.height:
@@ -205,7 +205,9 @@ class ScrollHandler:
         handle_rect = self._get_handle_rect()
         if handle_rect:
             # Check if mouse is over handle
-            is_hover = handle_rect.collidepoint(mouse_pos) or self.is_dragging
+            if mouse_pos is None and not self.is_dragging:
+                mouse_pos = pygame.mouse.get_pos()
+            is_hover = self.is_dragging or handle_rect.collidepoint(mouse_pos)
             handle_color = self.SCROLLBAR_HOVER if is_hover else self.SCROLLBAR_FG
 
             # Fill handle background
@@ -943,12 +943,9 @@ class PygameGUI:
         card_spacing = 110
         start_x = center_x - ((len(board) * card_spacing) // 2)
 
-        for i, card in enumerate(board):
-            x = start_x + i * card_spacing
-            y = center_y - 60
-            sprite = self.card_renderer.get_card_sprite(card, scale=(card_width, 140))
-            if sprite:
-                self.screen.blit(sprite, (x, y))
+        y = center_y - 60
+        positions = [(start_x + i * card_spacing, y) for i in range(len(board))]
+        self.card_renderer.blit_cards(self.screen, board, positions, scale=(card_width, 140))
 
     def render_pot(self, pot_amount: int):
         """Render pot amount"""
@@ -999,16 +996,14 @@ class PygameGUI:
         # Cards
         if player.get('active') and 'hand' in player and len(player['hand']) > 0:
             card_y = y - box_height//2 + 80
-            for i, card in enumerate(player['hand']):
-                card_x = x - box_width//2 + 10 + i * 70
-                if is_human or self.game_over or self.player_has_folded:
-                    # Show cards for human OR when game is over OR when player has folded (reveal all cards)
-                    sprite = self.card_renderer.get_card_sprite(card, scale=(60, 84))
-                else:
-                    # Show card back for AI during gameplay
-                    sprite = self.card_renderer.get_card_back(scale=(60, 84))
-                if sprite:
-                    self.screen.blit(sprite, (card_x, card_y))
+            hand = player['hand']
+            positions = [(x - box_width//2 + 10 + i * 70, card_y) for i in range(len(hand))]
+            # Show cards for human OR when game is over OR when player has folded (reveal all cards);
+            # show card backs for AI during gameplay
+            self.card_renderer.blit_cards(
+                self.screen, hand, positions, scale=(60, 84),
+                face_up=is_human or self.game_over or self.player_has_folded
+            )
 
         # Status
         if player.get('folded'):
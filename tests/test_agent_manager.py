@@ -0,0 +1,79 @@
+"""
+Test AgentManager's seat lookups at the edges of the seat range
+
+Agents are indexed by seat; seats that were never registered (including ones past
+the table size) fall back to the random agent, and negative IDs never alias a seat.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from poker_ev.agents.agent_manager import AgentManager
+from poker_ev.agents.state_converter import MAX_NUM_PLAYERS
+
+
+def fixed_agent(game):
+    return ('fixed', game)
+
+
+def random_fallback(game):
+    return ('random', game)
+
+
+def make_manager():
+    manager = AgentManager(seed=0)
+    # Make the fallback recognizable without a real game
+    manager.random_agent = random_fallback
+    return manager
+
+
+def test_unregistered_seat_past_table_falls_back():
+    """Seats beyond MAX_NUM_PLAYERS that were never registered behave like empty seats"""
+    manager = make_manager()
+    seat = MAX_NUM_PLAYERS + 3
+
+    assert not manager.has_agent(seat)
+    assert manager.get_action('game', seat) == ('random', 'game')
+    manager.unregister_agent(seat)  # No-op, must not raise
+
+
+def test_seat_past_table_can_be_registered():
+    """Registering beyond the preallocated seats grows the table"""
+    manager = make_manager()
+    seat = MAX_NUM_PLAYERS + 3
+    manager.register_agent(seat, fixed_agent)
+
+    assert manager.has_agent(seat)
+    assert manager.get_action('game', seat) == ('fixed', 'game')
+    assert not manager.has_agent(seat - 1)
+
+    manager.unregister_agent(seat)
+    assert not manager.has_agent(seat)
+
+
+def test_negative_ids_do_not_alias_seats():
+    """Negative IDs never reach the agent registered in the last seat"""
+    manager = make_manager()
+    manager.register_agent(MAX_NUM_PLAYERS - 1, fixed_agent)
+
+    assert not manager.has_agent(-1)
+    assert manager.get_action('game', -1) == ('random', 'game')
+
+    manager.unregister_agent(-1)
+    assert manager.has_agent(MAX_NUM_PLAYERS - 1)
+
+    with pytest.raises(ValueError):
+        manager.register_agent(-1, fixed_agent)
+    assert manager.get_action('game', MAX_NUM_PLAYERS - 1) == ('fixed', 'game')
+
+
+if __name__ == "__main__":
+    test_unregistered_seat_past_table_falls_back()
+    test_seat_past_table_can_be_registered()
+    test_negative_ids_do_not_alias_seats()
+    print("✓ AgentManager seat lookups handle out-of-range IDs")
@@ -0,0 +1,82 @@
+"""
+Test ChatInput editing after the text is assigned directly
+
+Assigning text replaces the gap buffer, so the prefix widths used by typing,
+deleting and cursor placement must be rebuilt with it.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from poker_ev.gui.chat.chat_input import ChatInput
+
+
+def make_input():
+    pygame.init()
+    font_path = project_root / "poker_ev" / "assets" / "fonts" / "FindersKeepers.ttf"
+    chat_input = ChatInput(pygame.Rect(0, 0, 400, 40), pygame.font.Font(str(font_path), 20))
+    chat_input.is_active = True
+    return chat_input
+
+
+def key(chat_input, key_code, unicode=''):
+    event = pygame.event.Event(pygame.KEYDOWN, key=key_code, unicode=unicode, mod=0)
+    return chat_input.handle_event(event)
+
+
+def assert_widths_match(chat_input):
+    font = chat_input.font
+    text = chat_input.text
+    assert chat_input._prefix_widths == [
+        sum(font.size(char)[0] for char in text[:i]) for i in range(len(text) + 1)
+    ]
+
+
+def test_type_and_backspace_after_assigning_text():
+    """Typing and backspacing after `text = ...` edit the assigned text"""
+    chat_input = make_input()
+    chat_input.text = "hello"
+    assert_widths_match(chat_input)
+
+    key(chat_input, pygame.K_a, 'a')
+    assert chat_input.text == "helloa"
+    key(chat_input, pygame.K_BACKSPACE)
+    key(chat_input, pygame.K_BACKSPACE)
+    assert chat_input.text == "hell"
+    assert_widths_match(chat_input)
+
+    # Shorter text, then edit in the middle
+    chat_input.text = "hi"
+    key(chat_input, pygame.K_LEFT)
+    key(chat_input, pygame.K_DELETE)
+    key(chat_input, pygame.K_o, 'o')
+    assert chat_input.text == "ho"
+    assert_widths_match(chat_input)
+
+
+def test_clear_and_set_text_keep_widths():
+    """clear() and set_text() go through the same setter"""
+    chat_input = make_input()
+    chat_input.set_text("raise 200")
+    assert_widths_match(chat_input)
+
+    chat_input.clear()
+    assert chat_input.text == ""
+    key(chat_input, pygame.K_BACKSPACE)
+    key(chat_input, pygame.K_f, 'f')
+    assert chat_input.text == "f"
+    assert_widths_match(chat_input)
+
+
+if __name__ == "__main__":
+    test_type_and_backspace_after_assigning_text()
+    test_clear_and_set_text_keep_widths()
+    print("✓ ChatInput edits after assigning text")
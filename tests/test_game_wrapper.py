@@ -0,0 +1,92 @@
+"""
+Test PokerGame.get_game_state() reuse
+
+The state dict is built once per game change (action, new hand or reset) and
+the same dict is returned until the next change.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from texasholdem import ActionType
+from poker_ev.engine.game_wrapper import PokerGame
+
+
+def test_state_is_reused_until_the_game_changes():
+    """Repeated calls return the same dict; an action returns a new, current one"""
+    game = PokerGame(num_players=6, buyin=500)
+    game.start_new_hand()
+
+    state = game.get_game_state()
+    assert game.get_game_state() is state
+
+    assert game.take_action(ActionType.CALL)
+    new_state = game.get_game_state()
+    assert new_state is not state
+    assert new_state == game._build_game_state()
+    assert new_state['current_player'] != state['current_player']
+
+
+def test_state_matches_engine_through_random_play():
+    """At every decision the reused state equals a freshly built one"""
+    rng = np.random.default_rng(0)
+    game = PokerGame(num_players=6, buyin=500)
+    for _ in range(20):
+        if not game.is_game_running():
+            break
+        assert game.start_new_hand()
+        while game.is_hand_running():
+            state = game.get_game_state()
+            assert state == game._build_game_state()
+
+            action = state['valid_actions'][int(rng.integers(len(state['valid_actions'])))]
+            amount = None
+            if action == ActionType.RAISE:
+                amount = state['min_raise'] + state['players'][state['current_player']]['bet'] \
+                    + state['chips_to_call']
+            if not game.take_action(action, amount):
+                assert game.take_action(ActionType.FOLD)
+
+        assert game.get_game_state() == game._build_game_state()
+        assert not game.get_game_state()['hand_active']
+
+
+def test_new_hand_and_reset_refresh_state():
+    """start_new_hand() and reset_game() both invalidate the reused dict"""
+    game = PokerGame(num_players=3, buyin=500)
+    idle = game.get_game_state()
+    assert not idle['hand_active']
+
+    game.start_new_hand()
+    in_hand = game.get_game_state()
+    assert in_hand['hand_active']
+
+    game.reset_game()
+    after_reset = game.get_game_state()
+    assert after_reset is not in_hand
+    assert not after_reset['hand_active']
+    assert all(player['chips'] == 500 for player in after_reset['players'])
+
+
+def test_failed_action_still_refreshes_state():
+    """A rejected action leaves a state that matches the engine"""
+    game = PokerGame(num_players=6, buyin=500)
+    game.start_new_hand()
+    state = game.get_game_state()
+
+    # Raising to less than the big blind is rejected by the engine
+    assert not game.take_action(ActionType.RAISE, 1)
+    assert game.get_game_state() == game._build_game_state() == state
+
+
+if __name__ == "__main__":
+    test_state_is_reused_until_the_game_changes()
+    test_state_matches_engine_through_random_play()
+    test_new_hand_and_reset_refresh_state()
+    test_failed_action_still_refreshes_state()
+    print("✓ PokerGame reuses its state dict until the game changes")
@@ -0,0 +1,175 @@
+"""
+Test MessageRenderer's caches: safe to share between threads, kept off the messages
+
+Streaming replies are measured on the advisor's worker thread while the render
+thread draws, so both threads look up, insert into and evict from the same caches.
+Per-message layouts and surfaces are cached in the renderer, not on the message
+dicts ChatPanel hands out.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from poker_ev.gui.chat.chat_panel import ChatPanel
+from poker_ev.gui.chat.message_renderer import MessageRenderer
+
+
+def make_renderer():
+    pygame.init()
+    font_path = project_root / "poker_ev" / "assets" / "fonts" / "FindersKeepers.ttf"
+    renderer = MessageRenderer(pygame.font.Font(str(font_path), 20), pygame.font.Font(str(font_path), 24))
+    # Tiny caches so entries are evicted constantly
+    renderer.CACHE_SIZE = 8
+    renderer.LINE_CACHE_SIZE = 4
+    return renderer
+
+
+class EvictingCache(OrderedDict):
+    """Cache whose entries are evicted right after they are read, as another thread might"""
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        self.pop(key, None)
+        return value
+
+
+class ClearedCache(OrderedDict):
+    """Cache that reports itself over full, then is cleared before the eviction"""
+
+    def __len__(self):
+        self.clear()
+        return MessageRenderer.CACHE_SIZE + 1
+
+
+def test_cache_get_tolerates_eviction_after_lookup():
+    """An entry evicted between lookup and LRU update is still returned"""
+    renderer = make_renderer()
+    cache = EvictingCache()
+    renderer._cache_put(cache, 'key', 42)
+
+    assert renderer._cache_get(cache, 'key') == 42
+    assert renderer._cache_get(cache, 'key') is None
+
+
+def test_cache_put_tolerates_concurrent_clear():
+    """Evicting from a cache another thread just cleared does not raise"""
+    renderer = make_renderer()
+    renderer._cache_put(ClearedCache(), 'key', 42)
+
+
+def test_concurrent_cache_use_does_not_raise():
+    """Lookups racing with evictions and clear_cache() must not raise KeyError"""
+    renderer = make_renderer()
+    errors = []
+
+    def measure(step):
+        try:
+            for i in range(5000):
+                word = 'w%d' % ((i * step) % 30)
+                renderer._text_width(renderer.font_medium, word)
+                renderer._get_styled_segment_width(word, MessageRenderer.STYLE_BOLD)
+                renderer._split_text_segments(word + '♠')
+                if i % 500 == 0:
+                    renderer.clear_cache()
+        except Exception as e:
+            errors.append(e)
+
+    # Switch threads often so lookups interleave with other threads' evictions
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=measure, args=(step,)) for step in (1, 3, 7, 11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+
+
+def test_streaming_measure_while_rendering():
+    """Measuring a streaming message off-thread while it is drawn keeps both working"""
+    renderer = make_renderer()
+    message = {'role': 'assistant', 'content': ''}
+    errors = []
+    done = threading.Event()
+
+    def stream():
+        try:
+            for i in range(300):
+                message['content'] += ' **pot** odds A♠ K♥ %d' % i
+                renderer.message_height(message)
+                renderer.measure_message(message)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.set()
+
+    worker = threading.Thread(target=stream)
+    worker.start()
+    try:
+        while not done.is_set():
+            renderer.prerender_message(message)
+    except Exception as e:
+        errors.append(e)
+    worker.join()
+
+    assert errors == []
+    surface = renderer.prerender_message(message)
+    assert surface.get_height() == renderer.message_height(message)
+
+
+def test_message_dicts_are_left_untouched():
+    """Layout and surface caches live in the renderer, not on the message dicts"""
+    renderer = make_renderer()
+    message = {'role': 'assistant', 'content': 'Fold **A♠ 7♦** here', 'timestamp': 0.0}
+    original = dict(message)
+
+    first = renderer.prerender_message(message)
+    renderer.measure_message(message)
+    assert message == original
+    assert renderer.prerender_message(message) is first
+
+    # A content change (streaming) still produces a new surface
+    message['content'] += ' and wait for a better spot to get your chips in'
+    assert renderer.prerender_message(message) is not first
+    assert renderer.prerender_message(message).get_height() == renderer.message_height(message)
+
+
+def test_chat_panel_messages_hold_no_surfaces():
+    """Messages handed out by ChatPanel contain only the message fields"""
+    pygame.init()
+    screen = pygame.display.set_mode((400, 600))
+    font_path = project_root / "poker_ev" / "assets" / "fonts" / "FindersKeepers.ttf"
+    fonts = [pygame.font.Font(str(font_path), size) for size in (14, 18, 24)]
+    panel = ChatPanel(pygame.Rect(0, 0, 400, 600), *fonts)
+
+    panel.add_message('user', 'Should I call?')
+    panel.start_streaming_message()
+    panel.append_to_streaming_message('Call, the **pot odds** are good.')
+    panel.render(screen)
+
+    for message in panel.get_messages():
+        assert set(message) == {'role', 'content', 'timestamp', 'metadata'}
+
+
+if __name__ == "__main__":
+    test_cache_get_tolerates_eviction_after_lookup()
+    test_cache_put_tolerates_concurrent_clear()
+    test_concurrent_cache_use_does_not_raise()
+    test_streaming_measure_while_rendering()
+    test_message_dicts_are_left_untouched()
+    test_chat_panel_messages_hold_no_surfaces()
+    print("✓ MessageRenderer caches are thread-safe")
@@ -0,0 +1,176 @@
+"""
+Test the neural agent's fast inference paths against PokerAgent
+
+NeuralAgentAdapter does not call PokerAgent.act() for trained models: legal-action
+masking and raise sizing are NumPy ports, and the forward pass runs in onnxruntime
+(float or int8) or the shared PyTorch module. These tests check each piece still
+agrees with PokerAgent.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pytest
+import torch
+from texasholdem import TexasHoldEm, ActionType
+from poker_ev.agents import neural_agent
+from poker_ev.agents.neural_agent import (
+    NeuralAgentAdapter,
+    PokerAgent,
+    HIDDEN_DIM,
+    _legal_action_mask,
+    _raise_amount_for_bucket,
+)
+from poker_ev.agents.state_converter import MockPokerEnv, STATE_DIM
+
+
+def make_model(seed: int = 0) -> PokerAgent:
+    torch.manual_seed(seed)
+    return PokerAgent(state_dim=STATE_DIM, hidden_dim=HIDDEN_DIM, device='cpu').eval()
+
+
+def random_env(rng: np.random.Generator) -> SimpleNamespace:
+    """PokerEnv-like state with the edges mixed in: no bets, busted and all-in players"""
+    num_players = int(rng.integers(2, 7))
+    bets = [int(b) for b in rng.choice([0, 5, 10, 20, 50, 200], size=num_players)]
+    if rng.random() < 0.3:
+        bets = [0] * num_players
+    money = [int(m) for m in rng.choice([0, 0, 5, 10, 15, 100, 1000], size=num_players)]
+    return SimpleNamespace(
+        active_players=[bool(a) for a in rng.random(num_players) < 0.8],
+        bets=bets,
+        money=money,
+        pot=sum(bets) + int(rng.choice([0, 15, 40, 300, 2000])),
+    )
+
+
+def random_games(seed: int, num_hands: int = 20):
+    """Yield (game, player_id) at every decision of randomly played hands"""
+    rng = np.random.default_rng(seed)
+    game = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=6)
+    for _ in range(num_hands):
+        if not game.is_game_running():
+            break
+        game.start_hand()
+        while game.is_hand_running():
+            player_id = game.current_player
+            yield game, player_id
+            moves = game.get_available_moves()
+            action = moves.action_types[int(rng.integers(len(moves.action_types)))]
+            if action == ActionType.RAISE:
+                raise_range = moves.raise_range
+                total = int(rng.integers(raise_range.start, raise_range.stop))
+                game.take_action(action, total=total)
+            else:
+                game.take_action(action)
+
+
+def test_legal_mask_matches_poker_agent_on_random_envs():
+    """_legal_action_mask agrees with PokerAgent.get_legal_actions for every player"""
+    model = make_model()
+    rng = np.random.default_rng(0)
+    for _ in range(2000):
+        env = random_env(rng)
+        for player_id in range(len(env.bets)):
+            expected = model.get_legal_actions(env, player_id).numpy()
+            np.testing.assert_array_equal(_legal_action_mask(env, player_id), expected)
+
+
+def test_legal_mask_matches_poker_agent_in_real_games():
+    """The masks also agree on MockPokerEnv synced from TexasHoldEm games"""
+    model = make_model()
+    mock_env = MockPokerEnv()
+    for game, player_id in random_games(seed=1):
+        env = mock_env.sync(game, player_id)
+        expected = model.get_legal_actions(env, player_id).numpy()
+        np.testing.assert_array_equal(_legal_action_mask(env, player_id), expected)
+
+
+@pytest.mark.parametrize("raise_bucket", [0, 1, 2, 3])
+def test_raise_bucket_maps_to_same_chips(raise_bucket):
+    """_raise_amount_for_bucket gives the chips PokerAgent.get_raise_amount would"""
+    model = make_model()
+    # Every other bucket has zero probability, so the sample is deterministic
+    bucket_logits = torch.full((4,), -1e9)
+    bucket_logits[raise_bucket] = 0.0
+
+    rng = np.random.default_rng(raise_bucket)
+    for _ in range(1000):
+        env = random_env(rng)
+        for player_id in range(len(env.bets)):
+            expected = model.get_raise_amount(env, player_id, bucket_logits)
+            assert _raise_amount_for_bucket(env, player_id, raise_bucket) == expected
+
+
+def test_onnx_logits_match_torch_forward(tmp_path):
+    """Float ONNX matches the torch forward; int8 stays within quantization error"""
+    pytest.importorskip("onnxruntime")
+    model = make_model()
+    onnx_path = tmp_path / "policy.onnx"
+    int8_path = tmp_path / "policy.int8.onnx"
+    neural_agent._export_onnx(model, onnx_path)
+    assert neural_agent._quantize_onnx(onnx_path, int8_path)
+
+    states = np.random.default_rng(0).random((256, STATE_DIM), dtype=np.float32)
+    with torch.no_grad():
+        expected = [output.numpy() for output in model(torch.from_numpy(states))]
+
+    # Measured: float ~1e-6, int8 ~0.01 on logits of magnitude ~0.5
+    for path, atol in ((onnx_path, 1e-4), (int8_path, 0.05)):
+        session = neural_agent._create_onnx_session(path)
+        outputs = session.run(neural_agent.ONNX_OUTPUT_NAMES, {'state': states})
+        for output, reference in zip(outputs, expected):
+            np.testing.assert_allclose(output, reference, atol=atol)
+
+
+@pytest.mark.parametrize("use_onnx", [True, False])
+def test_trained_adapter_returns_legal_actions(tmp_path, monkeypatch, use_onnx):
+    """Adapters with loaded weights only return moves the engine accepts"""
+    if use_onnx:
+        pytest.importorskip("onnxruntime")
+    else:
+        # Without onnxruntime the adapter runs the shared PyTorch forward
+        monkeypatch.setattr(neural_agent, 'ort', None)
+
+    model_path = tmp_path / "poker_agent_0_neutral.pt"
+    torch.save(make_model(seed=3).state_dict(), model_path)
+    agents = [NeuralAgentAdapter(str(model_path), player_id=i) for i in range(6)]
+    assert all(agent.weights_loaded for agent in agents)
+    assert (agents[0].session is not None) == use_onnx
+
+    game = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=6)
+    decisions = 0
+    for _ in range(30):
+        if not game.is_game_running():
+            break
+        game.start_hand()
+        while game.is_hand_running():
+            player_id = game.current_player
+            action, amount = agents[player_id](game)
+            total = amount if action == ActionType.RAISE else None
+            assert game.validate_move(player_id, action, total=total), (action, amount)
+            game.take_action(action, total=total)
+            decisions += 1
+
+    assert decisions > 0
+
+
+if __name__ == "__main__":
+    import tempfile
+    test_legal_mask_matches_poker_agent_on_random_envs()
+    test_legal_mask_matches_poker_agent_in_real_games()
+    for bucket in range(4):
+        test_raise_bucket_maps_to_same_chips(bucket)
+    with tempfile.TemporaryDirectory() as tmp:
+        test_onnx_logits_match_torch_forward(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp, pytest.MonkeyPatch.context() as mp:
+        test_trained_adapter_returns_legal_actions(Path(tmp), mp, use_onnx=True)
+    with tempfile.TemporaryDirectory() as tmp, pytest.MonkeyPatch.context() as mp:
+        test_trained_adapter_returns_legal_actions(Path(tmp), mp, use_onnx=False)
+    print("✓ Neural agent inference paths agree with PokerAgent")
@@ -0,0 +1,78 @@
+"""
+Test the neural agent's shared model caches
+
+Adapters share one loaded model (and ONNX session) per .pt file; the caches are
+keyed by the file's modification time so a retrained file is picked up.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import torch
+from poker_ev.agents.neural_agent import NeuralAgentAdapter, PokerAgent, HIDDEN_DIM
+from poker_ev.agents.state_converter import STATE_DIM
+
+
+def save_model(tmp_path: Path, seed: int = 0) -> Path:
+    """
+    Save a checkpoint in the current PokerAgent format (exports land next to it)
+
+    The weights are random but load like trained ones, so adapters take the
+    shared-model / ONNX paths.
+    """
+    torch.manual_seed(seed)
+    model_path = tmp_path / "poker_agent_0_neutral.pt"
+    torch.save(PokerAgent(state_dim=STATE_DIM, hidden_dim=HIDDEN_DIM, device='cpu').state_dict(),
+               model_path)
+    return model_path
+
+
+def test_adapters_share_model_for_same_file(tmp_path):
+    """Two adapters on the same unchanged file share one model"""
+    model_path = save_model(tmp_path)
+    first = NeuralAgentAdapter(str(model_path), player_id=1)
+    second = NeuralAgentAdapter(str(model_path), player_id=2)
+
+    assert first.weights_loaded and second.weights_loaded
+    assert first.model is second.model
+
+
+def test_retrained_file_is_reloaded(tmp_path):
+    """Rewriting the .pt file gives new adapters the new weights"""
+    model_path = save_model(tmp_path)
+    before = NeuralAgentAdapter(str(model_path), player_id=1)
+
+    # "Retrain": save different weights and move the modification time forward
+    state_dict = torch.load(model_path, map_location='cpu', weights_only=True)
+    state_dict['fc1.bias'] = state_dict['fc1.bias'] + 1.0
+    torch.save(state_dict, model_path)
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    after = NeuralAgentAdapter(str(model_path), player_id=1)
+
+    assert after.model is not before.model
+    assert torch.equal(after.model.fc1.bias, state_dict['fc1.bias'])
+    assert not torch.equal(after.model.fc1.bias, before.model.fc1.bias)
+
+    # The ONNX export is regenerated from the new weights, not the stale module
+    if after.session is not None:
+        state = torch.zeros(1, after.model.state_dim)
+        logits, _, _ = after.session.run(None, {'state': state.numpy()})
+        with torch.no_grad():
+            expected, _, _ = after.model(state)
+        assert abs(logits - expected.numpy()).max() < 0.2
+
+
+if __name__ == "__main__":
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        test_adapters_share_model_for_same_file(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_retrained_file_is_reloaded(Path(tmp))
+    print("✓ Neural agent model caches follow the model file")
@@ -0,0 +1,156 @@
+"""
+Test the reusable state that state_converter keeps between decisions
+
+Neural agents reuse one MockPokerEnv and sync it each decision instead of
+building a new one, and engine_snapshot() caches the betting-round values until
+the next action. Reused state must always match what the game reports now.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from texasholdem import TexasHoldEm, ActionType, PlayerState
+from poker_ev.agents.state_converter import (
+    MockPokerEnv,
+    create_mock_pokerenv_for_legal_actions,
+    engine_snapshot,
+)
+
+
+def random_games(seed: int, max_players: int = 6, num_hands: int = 20):
+    """Yield (game, player_id) at every decision of randomly played hands"""
+    rng = np.random.default_rng(seed)
+    game = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=max_players)
+    for _ in range(num_hands):
+        if not game.is_game_running():
+            break
+        game.start_hand()
+        while game.is_hand_running():
+            player_id = game.current_player
+            yield game, player_id
+            moves = game.get_available_moves()
+            action = moves.action_types[int(rng.integers(len(moves.action_types)))]
+            if action == ActionType.RAISE:
+                raise_range = moves.raise_range
+                game.take_action(action, total=int(rng.integers(raise_range.start, raise_range.stop)))
+            else:
+                game.take_action(action)
+
+
+def expected_env(game: TexasHoldEm):
+    """PokerEnv fields read straight from the game"""
+    bets = [game.player_bet_amount(i) for i in range(len(game.players))]
+    return {
+        'active_players': [player.state not in (PlayerState.SKIP, PlayerState.OUT)
+                           for player in game.players],
+        'bets': bets,
+        'money': [player.chips for player in game.players],
+        'pot': sum(pot.amount for pot in game.pots) + sum(bets),
+    }
+
+
+def env_fields(env: MockPokerEnv):
+    return {name: getattr(env, name) for name in MockPokerEnv.__slots__}
+
+
+def test_reused_env_matches_fresh_env():
+    """One env synced every decision matches a new env and the game itself"""
+    env = MockPokerEnv()
+    for game, player_id in random_games(seed=0):
+        assert env.sync(game, player_id) is env
+        fresh = create_mock_pokerenv_for_legal_actions(game, player_id)
+        assert env_fields(env) == env_fields(fresh) == expected_env(game)
+
+
+def test_reused_env_follows_table_size_changes():
+    """Syncing against a smaller or larger table resizes the buffers"""
+    env = MockPokerEnv()
+    for max_players in (6, 3, 9, 2):
+        for game, player_id in random_games(seed=max_players, max_players=max_players, num_hands=3):
+            env.sync(game, player_id)
+            assert len(env.bets) == len(env.money) == len(env.active_players) == max_players
+            assert env_fields(env) == expected_env(game)
+
+
+def expected_snapshot(game: TexasHoldEm):
+    return max(game.player_bet_amount(i) for i in range(len(game.players))), game.min_raise()
+
+
+def test_snapshot_follows_every_action_and_hand():
+    """The cached snapshot is recomputed after each action, street and new hand"""
+    for game, _ in random_games(seed=1, num_hands=30):
+        assert engine_snapshot(game) == expected_snapshot(game)
+        # Second lookup for the same decision is served from the cache
+        assert engine_snapshot(game) == expected_snapshot(game)
+
+
+def test_snapshot_reuses_values_until_an_action():
+    """Repeated lookups between actions do not query the engine again"""
+    game = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=6)
+    game.start_hand()
+    calls = []
+    min_raise = game.min_raise
+    game.min_raise = lambda: calls.append(1) or min_raise()
+
+    first = engine_snapshot(game)
+    assert engine_snapshot(game) == first
+    assert len(calls) == 1
+
+    game.take_action(ActionType.RAISE, total=40)
+    calls.clear()  # The engine checks min_raise itself while taking the action
+    assert engine_snapshot(game) == (40, 30)
+    assert engine_snapshot(game) == (40, 30)
+    assert len(calls) == 1
+
+
+def test_snapshot_refreshes_on_new_hand_at_same_point():
+    """A new hand reaching the same street and action count is not served stale values"""
+    game = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=6)
+    game.start_hand()
+    game.take_action(ActionType.RAISE, total=40)
+    assert engine_snapshot(game) == (40, 30)
+    while game.is_hand_running():
+        game.take_action(ActionType.FOLD)
+
+    game.start_hand()
+    game.take_action(ActionType.CALL)
+    assert engine_snapshot(game) == expected_snapshot(game) == (10, 10)
+
+
+def test_snapshot_is_per_game():
+    """Two games at the same point of play do not share cached values"""
+    first = TexasHoldEm(buyin=500, big_blind=10, small_blind=5, max_players=6)
+    second = TexasHoldEm(buyin=500, big_blind=20, small_blind=10, max_players=6)
+    first.start_hand()
+    second.start_hand()
+
+    assert engine_snapshot(first) == expected_snapshot(first) == (10, 10)
+    assert engine_snapshot(second) == expected_snapshot(second) == (20, 20)
+
+
+def test_snapshot_without_hand_history_is_not_cached():
+    """Game doubles without a hand history are read fresh on every call"""
+    bets = [5, 10, 0]
+    game = SimpleNamespace(players=[None] * 3, player_bet_amount=lambda i: bets[i],
+                           min_raise=lambda: 10)
+
+    assert engine_snapshot(game) == (10, 10)
+    bets[2] = 30
+    assert engine_snapshot(game) == (30, 10)
+
+
+if __name__ == "__main__":
+    test_reused_env_matches_fresh_env()
+    test_reused_env_follows_table_size_changes()
+    test_snapshot_follows_every_action_and_hand()
+    test_snapshot_reuses_values_until_an_action()
+    test_snapshot_refreshes_on_new_hand_at_same_point()
+    test_snapshot_is_per_game()
+    test_snapshot_without_hand_history_is_not_cached()
+    print("✓ state_converter reusable state matches the game")